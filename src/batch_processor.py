@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
 """
 배치 처리 시스템
-- ThreadPoolExecutor로 2개 동시 처리
+- ThreadPoolExecutor로 2개 동시 처리 (JEWELRY_BATCH_EXECUTOR=process 시 ProcessPoolExecutor)
 - 파일당 10분 타임아웃
 - 실패 시 계속 진행
 - 폴더 구조 기반 자동 타입 감지
 """
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Generator, Tuple, Dict, List
 from datetime import datetime
@@ -19,15 +21,24 @@ logger = logging.getLogger(__name__)
 # 지원하는 주얼리 타입
 JEWELRY_TYPES = ["ring", "necklace", "earring", "bracelet", "anklet", "etc"]
 
+# 지원하는 이미지 확장자
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.bmp'}
+
+# 배치 실행기 종류 (thread: 기본, API 대기 위주 / process: CPU 작업이 많을 때 GIL 회피)
+BATCH_EXECUTOR = os.getenv("JEWELRY_BATCH_EXECUTOR", "thread").lower()
+
 
 def get_image_files(directory: Path) -> List[Path]:
-    """디렉토리에서 이미지 파일 찾기"""
-    image_extensions = {'.jpg', '.jpeg', '.png', '.webp', '.bmp'}
+    """디렉토리에서 이미지 파일 찾기 (디렉토리 1회 스캔)"""
     image_files = []
     
-    for ext in image_extensions:
-        image_files.extend(directory.glob(f"*{ext}"))
-        image_files.extend(directory.glob(f"*{ext.upper()}"))
+    with os.scandir(directory) as it:
+        for entry in it:
+            # glob("*")과 동일하게 숨김 파일(예: macOS ._ 파일)은 제외
+            if entry.name.startswith('.'):
+                continue
+            if os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS and entry.is_file():
+                image_files.append(Path(entry.path))
     
     return sorted(image_files)
 
@@ -67,6 +78,23 @@ def process_inbox_folders(inbox_dir: Path) -> Dict[str, List[Path]]:
     return files_by_type
 
 
+def _process_single_file(file_path: Path, jewelry_type: str) -> Dict:
+    """단일 파일 처리 (프로세스 풀에서도 실행되도록 BatchProcessor 상태를 참조하지 않음)"""
+    try:
+        logger.info(f"Processing: {file_path.name}")
+        result = generate_all(
+            input_path=str(file_path),
+            item_type=jewelry_type
+        )
+        return result
+    except Exception as e:
+        logger.error(f"Failed to process {file_path.name}: {str(e)}")
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+
 class BatchProcessor:
     """배치 처리 관리자"""
     
@@ -86,6 +114,21 @@ class BatchProcessor:
             "start_time": None,
             "end_time": None
         }
+        # 중단 요청 플래그 (UI 종료 시 대기 중인 파일은 시작하지 않음)
+        self._cancel_event = threading.Event()
+    
+    def cancel(self):
+        """처리 중단 요청 (진행 중인 파일은 완료, 대기 중인 파일은 취소)"""
+        self._cancel_event.set()
+    
+    def _cancel_pending(self, futures) -> bool:
+        """중단 요청 시 아직 시작하지 않은 작업 취소"""
+        if not self._cancel_event.is_set():
+            return False
+        for future in futures:
+            future.cancel()
+        logger.info("Batch processing cancelled")
+        return True
     
     def process_batch(self, files: List[Path], jewelry_type: str) -> Generator[Tuple[Path, Dict], None, None]:
         """
@@ -103,11 +146,11 @@ class BatchProcessor:
         
         logger.info(f"Starting batch processing: {len(files)} files, {self.max_workers} workers")
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        with self._create_executor() as executor:
             # 모든 작업 제출
             future_to_file = {}
             for file_path in files:
-                future = executor.submit(self._process_single_file, file_path, jewelry_type)
+                future = executor.submit(_process_single_file, file_path, jewelry_type)
                 future_to_file[future] = file_path
             
             # 완료되는 대로 결과 수집
@@ -141,6 +184,9 @@ class BatchProcessor:
                         "error": error_msg,
                         "timeout": "timeout" in error_msg.lower()
                     }
+                
+                if self._cancel_pending(future_to_file):
+                    break
         
         self.stats["end_time"] = datetime.now()
         duration = self.stats["end_time"] - self.stats["start_time"]
@@ -151,21 +197,11 @@ class BatchProcessor:
         logger.info(f"  Failed: {self.stats['failed']}")
         logger.info(f"  Duration: {duration}")
     
-    def _process_single_file(self, file_path: Path, jewelry_type: str) -> Dict:
-        """단일 파일 처리"""
-        try:
-            logger.info(f"Processing: {file_path.name}")
-            result = generate_all(
-                input_path=str(file_path),
-                item_type=jewelry_type
-            )
-            return result
-        except Exception as e:
-            logger.error(f"Failed to process {file_path.name}: {str(e)}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+    def _create_executor(self):
+        """배치 실행기 생성 (JEWELRY_BATCH_EXECUTOR=process면 프로세스 풀 사용)"""
+        if BATCH_EXECUTOR == "process":
+            return ProcessPoolExecutor(max_workers=self.max_workers)
+        return ThreadPoolExecutor(max_workers=self.max_workers)
     
     def get_stats(self) -> Dict:
         """처리 통계 반환"""
@@ -208,13 +244,13 @@ class BatchProcessor:
         logger.info(f"Starting folder-based batch processing: {total_files} files across {len(files_by_type)} types")
         
         # 타입별로 병렬 처리
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        with self._create_executor() as executor:
             # 모든 작업 제출 (타입 정보도 함께)
             future_to_file = {}
             for jewelry_type, files in files_by_type.items():
                 logger.info(f"Submitting {len(files)} {jewelry_type} files for processing")
                 for file_path in files:
-                    future = executor.submit(self._process_single_file, file_path, jewelry_type)
+                    future = executor.submit(_process_single_file, file_path, jewelry_type)
                     future_to_file[future] = (file_path, jewelry_type)
             
             # 완료되는 대로 결과 수집
@@ -248,6 +284,9 @@ class BatchProcessor:
                         "error": error_msg,
                         "timeout": "timeout" in error_msg.lower()
                     }, jewelry_type
+                
+                if self._cancel_pending(future_to_file):
+                    break
         
         self.stats["end_time"] = datetime.now()
         duration = self.stats["end_time"] - self.stats["start_time"]
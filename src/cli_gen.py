@@ -4,7 +4,6 @@
 gen run, gen regen, gen export 등 명령 제공
 """
 import argparse
-import json
 import logging
 import shutil
 import sys
@@ -12,7 +11,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
-from .pipeline import generate_all
+from .pipeline import export_job, generate_all
+from .io_utils import peek_json_fields, write_json_atomic
 from .batch_processor import BatchProcessor, process_inbox_folders, get_image_files
 
 # 로깅 설정
@@ -194,8 +194,7 @@ def cmd_run(args):
     runs_dir.mkdir(exist_ok=True)
     
     summary_file = runs_dir / f"{run_id}.json"
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    write_json_atomic(summary_file, results, pretty=True)
     
     # 결과 출력
     logger.info("\n" + "="*60)
@@ -282,7 +281,6 @@ def cmd_regen(args):
     logger.info(f"Regenerating {args.artifact} for job {args.job}")
     
     # 기존 CLI 모듈 직접 호출
-    import json
     import subprocess
     
     job_dir = Path("out") / args.job
@@ -292,8 +290,8 @@ def cmd_regen(args):
         logger.error(f"Job {args.job} not found")
         return 1
     
-    with open(meta_path, 'r', encoding='utf-8') as f:
-        meta = json.load(f)
+    # 재생성에는 최상위 필드만 필요 (artifacts는 파싱하지 않음)
+    meta = peek_json_fields(meta_path, ("type", "input_path"))
     
     # work 이미지 준비
     work_dir = Path("work") / args.job
@@ -354,72 +352,16 @@ def cmd_regen(args):
 
 def cmd_export(args):
     """최종본 export"""
-    job_dir = Path("out") / args.job
-    if not job_dir.exists():
-        logger.error(f"Job not found: {args.job}")
-        return 1
-    
-    # meta.json 읽기
-    meta_path = job_dir / "meta.json"
-    if not meta_path.exists():
-        logger.error("meta.json not found")
+    try:
+        result = export_job(args.job, args.to)
+    except FileNotFoundError as e:
+        logger.error(str(e))
         return 1
     
-    with open(meta_path, 'r', encoding='utf-8') as f:
-        meta = json.load(f)
-    
-    # export 디렉토리 생성
-    export_dir = Path(args.to)
-    export_dir.mkdir(parents=True, exist_ok=True)
-    
-    # 각 artifact의 최신 버전 복사
-    exported = []
-    
-    for artifact_type in ["desc", "styled", "wear", "closeup"]:
-        artifact_info = meta["artifacts"].get(artifact_type, {})
-        if artifact_info.get("latest", 0) > 0:
-            # 최신 파일 찾기
-            latest_file = job_dir / artifact_type / (
-                f"{artifact_type}.md" if artifact_type == "desc" else f"{artifact_type}.png"
-            )
-            
-            if latest_file.exists() or latest_file.is_symlink():
-                # 실제 파일 경로 가져오기 (심볼릭 링크 해결)
-                real_file = latest_file.resolve()
-                
-                # export 경로
-                if artifact_type == "desc":
-                    export_file = export_dir / "description.md"
-                else:
-                    export_file = export_dir / f"{artifact_type}.png"
-                
-                # 복사
-                shutil.copy2(real_file, export_file)
-                exported.append({
-                    "type": artifact_type,
-                    "source": str(latest_file),
-                    "destination": str(export_file)
-                })
-                
-                logger.info(f"Exported {artifact_type} -> {export_file}")
-    
-    # manifest.json 생성
-    manifest = {
-        "job_id": meta["job_id"],
-        "item_type": meta["type"],
-        "exported_at": datetime.now().isoformat(),
-        "source_job": str(job_dir),
-        "artifacts": exported
-    }
-    
-    manifest_path = export_dir / "manifest.json"
-    with open(manifest_path, 'w', encoding='utf-8') as f:
-        json.dump(manifest, f, indent=2, ensure_ascii=False)
-    
     logger.info(f"\n✅ Export complete!")
-    logger.info(f"Destination: {export_dir}")
-    logger.info(f"Artifacts: {len(exported)}")
-    logger.info(f"Manifest: {manifest_path}")
+    logger.info(f"Destination: {result['export_dir']}")
+    logger.info(f"Artifacts: {len(result['manifest']['artifacts'])}")
+    logger.info(f"Manifest: {result['manifest_path']}")
     
     return 0
 
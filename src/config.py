@@ -19,6 +19,11 @@ MAX_SIDE = 2048  # 입력 이미지 최대 크기
 OUT_1TO1 = 1024  # 1:1 비율 출력 크기
 OUT_2X3 = (1024, 1536)  # 2:3 비율 출력 크기
 
+# API 호출 상수
+API_TIMEOUT_TEXT = 60.0  # 텍스트 생성 요청 타임아웃 (초)
+API_TIMEOUT_IMAGE = 180.0  # 이미지 생성 요청 타임아웃 (초, 클라이언트 기본값)
+API_MAX_RETRIES = 3  # 429/5xx/타임아웃 시 재시도 횟수 (지수 백오프)
+
 
 @dataclass
 class Config:
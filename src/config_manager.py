@@ -9,6 +9,27 @@ from typing import Dict, Optional
 import shutil
 
 
+# 작업 폴더 하위 구조 (상위 폴더가 먼저 오도록 정렬)
+WORK_SUBFOLDERS = (
+    "inbox",
+    "inbox/ring",
+    "inbox/necklace",
+    "inbox/earring",
+    "inbox/bracelet",
+    "inbox/anklet",
+    "inbox/other",
+    "out",
+    "export",
+    "logs",
+    "work",
+    "archive",
+    "archive/success",
+    "archive/failed",
+    "samples",
+    "presets",
+)
+
+
 class ConfigManager:
     """설정 관리 클래스"""
     
@@ -53,12 +74,15 @@ class ConfigManager:
             return self.default_config.copy()
     
     def save_config(self, config: Dict):
-        """설정 파일 저장"""
+        """설정 파일 저장 (임시 파일에 쓴 뒤 교체 - 저장 중 종료되어도 기존 설정 유지)"""
+        tmp_file = self.config_file.with_name(f".{self.config_file.name}.{os.getpid()}.tmp")
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
                 json.dump(config, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_file, self.config_file)
         except Exception as e:
             print(f"설정 파일 저장 실패: {e}")
+            tmp_file.unlink(missing_ok=True)
     
     def get_work_folder(self) -> Optional[Path]:
         """작업 폴더 경로 반환"""
@@ -82,40 +106,24 @@ class ConfigManager:
     
     def create_work_folders(self, base_path: Path):
         """작업에 필요한 폴더들 생성"""
-        folders = [
-            "inbox",
-            "inbox/ring",
-            "inbox/necklace", 
-            "inbox/earring",
-            "inbox/bracelet",
-            "inbox/anklet",
-            "inbox/other",
-            "out",
-            "export", 
-            "logs",
-            "work",
-            "archive",
-            "archive/success",
-            "archive/failed",
-            "samples",
-            "presets"
-        ]
-        
         created_folders = []
-        for folder in folders:
-            folder_path = base_path / folder
-            if not folder_path.exists():
-                folder_path.mkdir(parents=True, exist_ok=True)
+        for folder in WORK_SUBFOLDERS:
+            # exists() 확인 없이 바로 생성 시도 - 이미 있으면 FileExistsError (폴더당 시스템 호출 1회)
+            try:
+                (base_path / folder).mkdir(parents=True)
                 created_folders.append(folder)
+            except FileExistsError:
+                pass
         
-        # 작업 폴더에 default_prompts.json 생성
+        # 작업 폴더에 default_prompts.json 생성 ('x' 모드: 이미 있으면 FileExistsError)
         work_prompts_file = base_path / "default_prompts.json"
-        if not work_prompts_file.exists():
-            default_prompts = self._get_default_prompts()
-            with open(work_prompts_file, 'w', encoding='utf-8') as f:
-                json.dump(default_prompts, f, indent=2, ensure_ascii=False)
+        try:
+            with open(work_prompts_file, 'x', encoding='utf-8') as f:
+                json.dump(self._get_default_prompts(), f, indent=2, ensure_ascii=False)
             print(f"✅ default_prompts.json 생성됨: {work_prompts_file}")
             created_folders.append("default_prompts.json")
+        except FileExistsError:
+            pass
         
         return created_folders
     
@@ -355,6 +363,13 @@ class ConfigManager:
         prompts_config["jewelry_specific"][jewelry_type][prompt_type] = content
         self.save_prompts_config(prompts_config)
     
+    def update_jewelry_specific_prompts_bulk(self, jewelry_type: str, prompts: Dict[str, str]):
+        """주얼리 타입별 추가 프롬프트 여러 개를 한 번에 업데이트 (파일 저장 1회)"""
+        prompts_config = self.load_prompts_config()
+        jewelry_specific = prompts_config.setdefault("jewelry_specific", {})
+        jewelry_specific.setdefault(jewelry_type, {}).update(prompts)
+        self.save_prompts_config(prompts_config)
+    
     def get_jewelry_types_with_prompts(self) -> list:
         """추가 프롬프트가 설정된 주얼리 타입 목록"""
         prompts_config = self.load_prompts_config()
@@ -6,12 +6,11 @@ import logging
 from pathlib import Path
 from typing import List
 
-import openai
 from PIL import Image
 
 from .config import get_config, OUT_1TO1, OUT_2X3
 from .io_utils import resize_image, save_image
-from .text_gen import load_prompt
+from .text_gen import get_image_client, load_prompt
 
 
 logger = logging.getLogger(__name__)
@@ -24,7 +23,7 @@ def generate_thumbnail(
 ) -> Path:
     """누끼컷(1:1) 생성"""
     config = get_config()
-    client = openai.Client(api_key=config.OPENAI_API_KEY)
+    client = get_image_client()
     
     # 프롬프트 로드
     prompt = load_prompt("thumb", jewelry_type)
@@ -127,7 +126,7 @@ def generate_styled_shot(
 ) -> List[Path]:
     """제품 연출컷(2:3) 생성"""
     config = get_config()
-    client = openai.Client(api_key=config.OPENAI_API_KEY)
+    client = get_image_client()
     
     # 프롬프트 로드
     prompt = load_prompt("styled", jewelry_type)
@@ -217,7 +216,7 @@ def generate_wear_shot(
 ) -> List[Path]:
     """착용컷(2:3) 생성"""
     config = get_config()
-    client = openai.Client(api_key=config.OPENAI_API_KEY)
+    client = get_image_client()
     
     # 프롬프트 로드
     prompt = load_prompt("wear", jewelry_type)
@@ -307,7 +306,7 @@ def generate_wear_closeup(
 ) -> List[Path]:
     """클로즈업 착용컷(2:3) 생성"""
     config = get_config()
-    client = openai.Client(api_key=config.OPENAI_API_KEY)
+    client = get_image_client()
     
     # 프롬프트 로드
     prompt = load_prompt("wear_closeup", jewelry_type)
@@ -2,15 +2,27 @@
 파일 입출력 유틸리티
 이미지 리사이징, 확장자 처리, 디렉토리 관리
 """
+import functools
+import json
 import logging
+import mmap
+import os
+import re
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from PIL import Image
 
 from .config import MAX_SIDE, get_config
 
+try:
+    import orjson
+except ImportError:
+    # orjson이 없으면 표준 json 모듈 사용
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -119,4 +131,89 @@ def get_aspect_ratio_size(ratio: str, base_width: int = 1024) -> Tuple[int, int]
         "9:16": (base_width, int(base_width * 16 / 9)),
     }
     
-    return ratios.get(ratio, (base_width, base_width))
\ No newline at end of file
+    return ratios.get(ratio, (base_width, base_width))
+
+
+def dumps_json(data: Any, pretty: bool = False) -> bytes:
+    """JSON 직렬화 (orjson 사용 가능 시 orjson 사용, UTF-8 바이트 반환)"""
+    # 내부 상태 파일은 기본적으로 공백 없는 compact 형식으로 저장
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def loads_json(raw: bytes) -> Any:
+    """JSON 바이트 파싱 (orjson 사용 가능 시 orjson 사용)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def read_json(path: Path) -> Any:
+    """JSON 파일 로드"""
+    return loads_json(Path(path).read_bytes())
+
+
+def write_json_atomic(path: Path, data: Any, pretty: bool = False) -> None:
+    """JSON 파일 원자적 저장 (임시 파일에 쓴 뒤 교체)"""
+    # 스레드/프로세스별 임시 파일을 사용해 동시 저장 시 충돌 방지
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp_path.write_bytes(dumps_json(data, pretty=pretty))
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+@functools.lru_cache(maxsize=32)
+def _json_string_field_re(key: str) -> "re.Pattern":
+    """JSON 문자열 필드 값을 찾는 정규식"""
+    return re.compile(rb'"' + re.escape(key.encode('utf-8')) + rb'"\s*:\s*("(?:[^"\\]|\\.)*")')
+
+
+def peek_json_fields(path: Path, keys: Iterable[str]) -> Dict[str, Any]:
+    """JSON 파일의 최상위 문자열 필드만 빠르게 읽기 (찾지 못하면 전체 파싱)"""
+    keys = tuple(keys)
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # 최상위 필드는 "artifacts" 앞에 기록되므로 그 앞부분만 스캔
+            end = mm.find(b'"artifacts"')
+            head = mm[:end] if end != -1 else mm[:]
+    except ValueError:
+        # 빈 파일은 mmap 불가 - 전체 파싱으로 오류 처리
+        head = b''
+    
+    result = _match_json_fields(head, keys)
+    if result is None:
+        # 문자열이 아니거나 위치를 특정할 수 없는 경우 전체 파싱
+        data = read_json(path)
+        return {k: data[k] for k in keys if k in data}
+    return result
+
+
+def peek_json_bytes(raw: bytes, keys: Iterable[str]) -> Dict[str, Any]:
+    """이미 읽어 둔 JSON 바이트에서 최상위 문자열 필드만 빠르게 읽기"""
+    keys = tuple(keys)
+    end = raw.find(b'"artifacts"')
+    result = _match_json_fields(raw[:end] if end != -1 else raw, keys)
+    if result is None:
+        data = loads_json(raw)
+        return {k: data[k] for k in keys if k in data}
+    return result
+
+
+def _match_json_fields(head: bytes, keys: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+    """정규식으로 필드 값 추출 (하나라도 못 찾으면 None)"""
+    result = {}
+    for key in keys:
+        match = _json_string_field_re(key).search(head)
+        if match is None:
+            return None
+        result[key] = json.loads(match.group(1))
+    return result
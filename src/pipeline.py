@@ -3,82 +3,183 @@
 핵심 파이프라인 함수들
 - generate_all: 4개 산출물 일괄 생성
 - regenerate: 개별 산출물 재생성
+- export_job: 최신 산출물 export
 """
+import asyncio
+import functools
 import hashlib
 import json
 import logging
+import os
+import re
 import shutil
-import subprocess
-import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Literal, Any
+from typing import Callable, Dict, List, Optional, Literal, Any
 from PIL import Image
 
+from .io_utils import read_json, write_json_atomic
+from .processor import (
+    process_description,
+    process_styled,
+    process_wear,
+    process_wear_closeup
+)
+
 logger = logging.getLogger(__name__)
 
 ArtifactType = Literal["desc", "styled", "wear", "closeup"]
 
-STANDARD_JEWELRY_TYPES = ["ring", "necklace", "earring", "bracelet", "anklet"]
+STANDARD_JEWELRY_TYPES: frozenset = frozenset({"ring", "necklace", "earring", "bracelet", "anklet"})
 
+# meta.json에 기록되는 산출물 종류
+META_ARTIFACT_KEYS = ("desc", "styled", "wear", "closeup", "styled2", "styled3")
+
+# 생성된 산출물 이미지 파일명 패턴
+OUTPUT_IMAGE_RE = re.compile(r".*_(2x3|3x4)_.*\.png$")
+CLOSEUP_IMAGE_RE = re.compile(r"wear_closeup_.*x.*_.*\.png$")
+
+# job_id 디스크 캐시 (프로세스 간 공유)
+JOB_ID_CACHE_FILE = Path("work") / ".job_id_cache.json"
+JOB_ID_CACHE_MAX_ENTRIES = 1024
+_job_id_cache_lock = threading.Lock()
+
+
+def new_artifacts() -> Dict[str, Dict[str, Any]]:
+    """meta.json의 빈 artifacts 구조 생성"""
+    return {key: {"latest": 0, "versions": []} for key in META_ARTIFACT_KEYS}
+
+
+def _load_job_id_cache() -> Dict[str, str]:
+    """디스크 job_id 캐시 로드"""
+    try:
+        cache = read_json(JOB_ID_CACHE_FILE)
+        return cache if isinstance(cache, dict) else {}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    except Exception as e:
+        logger.warning(f"job_id 캐시 로드 실패: {e}")
+        return {}
+
+
+@functools.lru_cache(maxsize=256)
+def _job_id_for(path_str: str, mtime_ns: int, size: int, item_type: str) -> str:
+    """파일 지문(경로, mtime, 크기)과 item_type으로 job_id 계산 (메모리 캐시)"""
+    fingerprint = f"{path_str}|{mtime_ns}|{size}|{item_type}"
+
+    with _job_id_cache_lock:
+        cached = _load_job_id_cache().get(fingerprint)
+    if cached:
+        return cached
+
+    file_bytes = Path(path_str).read_bytes()
 
-def generate_job_id(file_path: Path, item_type: str) -> str:
-    """파일 바이트와 item_type으로 job_id 생성 (SHA1 기반)"""
-    with open(file_path, 'rb') as f:
-        file_bytes = f.read()
-    
     # 파일 바이트 + item_type을 조합하여 해시 생성
     content = file_bytes + item_type.encode('utf-8')
     sha1_hash = hashlib.sha1(content).hexdigest()
-    
+
     # 앞 12자리만 사용
-    return f"J{sha1_hash[:11]}"
+    job_id = f"J{sha1_hash[:11]}"
 
+    # 디스크 캐시에 기록 (오래된 항목부터 정리)
+    try:
+        with _job_id_cache_lock:
+            cache = _load_job_id_cache()
+            cache[fingerprint] = job_id
+            while len(cache) > JOB_ID_CACHE_MAX_ENTRIES:
+                cache.pop(next(iter(cache)))
+            JOB_ID_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            write_json_atomic(JOB_ID_CACHE_FILE, cache)
+    except Exception as e:
+        logger.warning(f"job_id 캐시 저장 실패: {e}")
+
+    return job_id
+
+
+def generate_job_id(file_path: Path, item_type: str) -> str:
+    """파일 바이트와 item_type으로 job_id 생성 (SHA1 기반)"""
+    # 파일 내용이 바뀌면 mtime/size가 바뀌므로 stat만으로 캐시 조회
+    st = file_path.stat()
+    return _job_id_for(str(file_path.resolve()), st.st_mtime_ns, st.st_size, item_type)
+
+
+def resize_image(image_path: Path, max_size: int = 2048, out_path: Optional[Path] = None) -> Path:
+    """이미지 리사이즈 (최대 크기 제한, out_path가 없으면 결과는 work 디렉토리에 캐시)"""
+    if out_path is None:
+        # 원본 크기/수정시각/최대 크기로 캐시 키 구성
+        st = image_path.stat()
+        cache_key = f"{st.st_size}_{st.st_mtime_ns}_{max_size}_{image_path.stem}"
+        resized_path = Path("work") / f"resized_{cache_key}{image_path.suffix}"
+
+        # 이전에 리사이즈한 결과가 있으면 재사용
+        if resized_path.exists():
+            return resized_path
+        _evict_stale_resized(image_path, max_size, resized_path)
+    else:
+        # 지정된 경로에 바로 저장 (임시 파일 + 복사 생략)
+        resized_path = out_path
+
+    # Image.open은 헤더만 읽으므로 크기 확인만으로는 디코딩하지 않음
+    with Image.open(image_path) as img:
+        # 이미지가 이미 작으면 재인코딩하지 않음
+        if img.width <= max_size and img.height <= max_size:
+            if out_path is None:
+                return image_path
+            # 사용자 원본에 링크하면 archive 이동 후 깨지거나 원본에 덮어쓰므로 복사
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(image_path, out_path)
+            return out_path
+
+        # 리사이즈 필요
+        ratio = min(max_size / img.width, max_size / img.height)
+        new_size = (int(img.width * ratio), int(img.height * ratio))
+
+        # reducing_gap: 큰 폭 축소 시 정수배 축소를 먼저 수행해 LANCZOS 비용 절감
+        resized = img.resize(new_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
+        src_format = img.format
+
+    # 저장 (임시 파일에 쓴 뒤 교체하여 반쯤 쓰인 파일 방지)
+    resized_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = resized_path.with_name(f".{resized_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    resized.save(tmp_path, format=src_format, quality=95)
+    os.replace(tmp_path, resized_path)
 
-def resize_image(image_path: Path, max_size: int = 2048) -> Path:
-    """이미지 리사이즈 (최대 크기 제한)"""
-    img = Image.open(image_path)
-    
-    # 이미지가 이미 작으면 그대로 반환
-    if img.width <= max_size and img.height <= max_size:
-        return image_path
-    
-    # 리사이즈 필요
-    ratio = min(max_size / img.width, max_size / img.height)
-    new_size = (int(img.width * ratio), int(img.height * ratio))
-    
-    resized = img.resize(new_size, Image.Resampling.LANCZOS)
-    
-    # work 디렉토리에 임시 저장
-    work_dir = Path("work")
-    work_dir.mkdir(exist_ok=True)
-    
-    resized_path = work_dir / f"resized_{image_path.name}"
-    resized.save(resized_path, quality=95)
-    
     return resized_path
 
 
-def run_generation_command(cmd: List[str], artifact_type: str) -> Dict[str, Any]:
-    """생성 명령 실행 및 결과 반환"""
+def _evict_stale_resized(image_path: Path, max_size: int, keep: Path) -> None:
+    """같은 원본의 이전 리사이즈 캐시 파일 삭제 (원본이 바뀔 때마다 쌓이지 않도록)"""
+    pattern = re.compile(rf"resized_\d+_\d+_{max_size}_{re.escape(image_path.stem)}{re.escape(image_path.suffix)}")
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            return {
-                "success": True,
-                "artifact": artifact_type,
-                "stdout": result.stdout,
-                "stderr": result.stderr
-            }
-        else:
-            return {
-                "success": False,
-                "artifact": artifact_type,
-                "error": result.stderr or "Unknown error",
-                "stdout": result.stdout
-            }
+        with os.scandir("work") as it:
+            for entry in it:
+                if entry.name != keep.name and pattern.fullmatch(entry.name):
+                    Path(entry.path).unlink(missing_ok=True)
+    except FileNotFoundError:
+        pass
+
+
+def find_output_images(artifact_dir: Path, pattern: re.Pattern) -> List[Path]:
+    """산출물 디렉토리에서 패턴에 맞는 이미지 파일 목록 반환"""
+    try:
+        with os.scandir(artifact_dir) as it:
+            return sorted(Path(e.path) for e in it if e.is_file() and pattern.match(e.name))
+    except FileNotFoundError:
+        return []
+
+
+def run_generation_task(fn: Callable[..., Path], kwargs: Dict[str, Any], artifact_type: str) -> Dict[str, Any]:
+    """생성 함수를 프로세스 내에서 실행 및 결과 반환"""
+    try:
+        output_dir = fn(**kwargs)
+        return {
+            "success": True,
+            "artifact": artifact_type,
+            "output_dir": str(output_dir)
+        }
     except Exception as e:
+        logger.error(f"{artifact_type} 생성 실패: {e}")
         return {
             "success": False,
             "artifact": artifact_type,
@@ -86,24 +187,36 @@ def run_generation_command(cmd: List[str], artifact_type: str) -> Dict[str, Any]
         }
 
 
+async def run_generation_tasks_concurrently(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """생성 작업들을 동시에 실행 (결과는 tasks 순서대로 반환)"""
+    # 생성 함수는 동기 API 호출이므로 기본 스레드 풀에서 실행하고 이벤트 루프에서 모아서 대기
+    # (asyncio.to_thread는 Python 3.9 이상이므로 run_in_executor 사용)
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(*(
+        loop.run_in_executor(None, functools.partial(run_generation_task, task["fn"], task["kwargs"], task["type"]))
+        for task in tasks
+    ))
+
+
 def update_meta_json(meta_path: Path, artifact_type: str, version: int, 
-                    prompt_data: Dict, success: bool, error: Optional[str] = None):
-    """meta.json 업데이트"""
-    # 기존 meta.json 읽기
-    if meta_path.exists():
-        with open(meta_path, 'r', encoding='utf-8') as f:
-            meta = json.load(f)
-    else:
-        # 새로 생성
-        meta = {
-            "artifacts": {
-                "desc": {"latest": 0, "versions": []},
-                "styled": {"latest": 0, "versions": []},
-                "wear": {"latest": 0, "versions": []},
-                "closeup": {"latest": 0, "versions": []},
-            },
-            "errors": []
-        }
+                    prompt_data: Dict, success: bool, error: Optional[str] = None,
+                    meta: Optional[Dict] = None, save: bool = True,
+                    timestamp: Optional[str] = None) -> Dict:
+    """meta.json 업데이트 (meta가 주어지면 메모리 상의 dict를 갱신, 갱신된 dict 반환)"""
+    # 같은 작업에서 생성된 항목은 동일한 시각을 공유
+    if timestamp is None:
+        timestamp = datetime.now().isoformat(timespec='seconds')
+    
+    # 메모리 상의 meta가 없으면 기존 meta.json 읽기
+    if meta is None:
+        if meta_path.exists():
+            meta = read_json(meta_path)
+        else:
+            # 새로 생성
+            meta = {
+                "artifacts": new_artifacts(),
+                "errors": []
+            }
     
     # 성공한 경우에만 버전 정보 추가
     if success:
@@ -120,7 +233,7 @@ def update_meta_json(meta_path: Path, artifact_type: str, version: int,
             "v": version,
             "path": file_path,
             "prompt": prompt_data,
-            "created_at": datetime.now().isoformat()
+            "created_at": timestamp
         }
         
         artifact_data["versions"].append(version_info)
@@ -141,12 +254,14 @@ def update_meta_json(meta_path: Path, artifact_type: str, version: int,
         meta["errors"].append({
             "artifact": artifact_type,
             "error": error,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         })
     
     # meta.json 저장
-    with open(meta_path, 'w', encoding='utf-8') as f:
-        json.dump(meta, f, indent=2, ensure_ascii=False)
+    if save:
+        write_json_atomic(meta_path, meta)
+    
+    return meta
 
 
 def generate_all(input_path: str, item_type: str, out_dir: Optional[str] = None) -> Dict:
@@ -163,9 +278,15 @@ def generate_all(input_path: str, item_type: str, out_dir: Optional[str] = None)
     """
     input_path = Path(input_path)
     
-    # job_id 생성
+    # 작업 시작 시각 (created_at 및 이번 작업의 모든 버전에 공통 사용)
+    now_iso = datetime.now().isoformat(timespec='seconds')
+    
+    # job_id 생성 (job_id 호환을 위해 item_type 원문 사용)
     job_id = generate_job_id(input_path, item_type)
     
+    # 표준 주얼리 타입 여부는 한 번만 판별
+    is_standard_type = item_type.lower() in STANDARD_JEWELRY_TYPES
+    
     # 출력 디렉토리 설정
     if out_dir is None:
         out_dir = f"out/{job_id}"
@@ -175,10 +296,10 @@ def generate_all(input_path: str, item_type: str, out_dir: Optional[str] = None)
     work_dir = Path("work") / job_id
     work_dir.mkdir(parents=True, exist_ok=True)
     
-    # 이미지 리사이즈 및 work 디렉토리로 복사
-    resized_path = resize_image(input_path)
+    # 이미지 리사이즈 결과를 Job의 work 디렉토리에 바로 저장 (같은 Job이면 재사용)
     work_image = work_dir / "input.png"
-    shutil.copy2(resized_path, work_image)
+    if not work_image.exists():
+        resize_image(input_path, out_path=work_image)
     
     # meta.json 초기화
     meta_path = out_path / "meta.json"
@@ -189,21 +310,14 @@ def generate_all(input_path: str, item_type: str, out_dir: Optional[str] = None)
         "src_name": input_path.name,
         "type": item_type,
         "status": "processing",
-        "created_at": datetime.now().isoformat(),
+        "created_at": now_iso,
         "input_path": str(input_path),
-        "artifacts": {
-            "desc": {"latest": 0, "versions": []},
-            "styled": {"latest": 0, "versions": []},
-            "wear": {"latest": 0, "versions": []},
-            "closeup": {"latest": 0, "versions": []},
-            "styled2": {"latest": 0, "versions": []},
-            "styled3": {"latest": 0, "versions": []},
-        },
+        "artifacts": new_artifacts(),
         "errors": []
     }
     
-    with open(meta_path, 'w', encoding='utf-8') as f:
-        json.dump(initial_meta, f, indent=2, ensure_ascii=False)
+    write_json_atomic(meta_path, initial_meta)
+    meta = initial_meta
     
     # 생성 작업 목록 구성
     tasks = []
@@ -217,45 +331,45 @@ def generate_all(input_path: str, item_type: str, out_dir: Optional[str] = None)
     # 1. 상품 설명 생성
     tasks.append({
         "type": "desc",
-        "cmd": [
-            sys.executable, "-m", "src.cli_desc",
-            "--image", str(work_image),
-            "--type", item_type,
-            "--out", str(out_path / "desc")
-        ]
+        "fn": process_description,
+        "kwargs": {
+            "image_path": str(work_image),
+            "jewelry_type": item_type,
+            "output_dir": str(out_path / "desc")
+        }
     })
     
     # 2. 제품 연출컷
     tasks.append({
         "type": "styled",
-        "cmd": [
-            sys.executable, "-m", "src.cli_styled",
-            "--image", str(work_image),
-            "--type", item_type,
-            "--out", str(out_path / "styled")
-        ]
+        "fn": process_styled,
+        "kwargs": {
+            "image_path": str(work_image),
+            "jewelry_type": item_type,
+            "output_dir": str(out_path / "styled")
+        }
     })
     
     # 3. 표준 주얼리 타입인 경우 착용컷과 클로즈업
-    if item_type.lower() in STANDARD_JEWELRY_TYPES:
+    if is_standard_type:
         tasks.append({
             "type": "wear",
-            "cmd": [
-                sys.executable, "-m", "src.cli_wear",
-                "--image", str(work_image),
-                "--type", item_type,
-                "--out", str(out_path / "wear")
-            ]
+            "fn": process_wear,
+            "kwargs": {
+                "image_path": str(work_image),
+                "jewelry_type": item_type,
+                "output_dir": str(out_path / "wear")
+            }
         })
         
         tasks.append({
             "type": "closeup",
-            "cmd": [
-                sys.executable, "-m", "src.cli_wear_closeup",
-                "--image", str(work_image),
-                "--type", item_type,
-                "--out", str(out_path / "closeup")
-            ]
+            "fn": process_wear_closeup,
+            "kwargs": {
+                "image_path": str(work_image),
+                "jewelry_type": item_type,
+                "output_dir": str(out_path / "closeup")
+            }
         })
     else:
         # 기타 주얼리는 연출컷 3개 추가 생성
@@ -263,19 +377,20 @@ def generate_all(input_path: str, item_type: str, out_dir: Optional[str] = None)
             styled_dir = out_path / f"styled{i}"
             tasks.append({
                 "type": f"styled{i}",
-                "cmd": [
-                    sys.executable, "-m", "src.cli_styled",
-                    "--image", str(work_image),
-                    "--type", item_type,
-                    "--out", str(styled_dir)
-                ]
+                "fn": process_styled,
+                "kwargs": {
+                    "image_path": str(work_image),
+                    "jewelry_type": item_type,
+                    "output_dir": str(styled_dir)
+                }
             })
     
-    # 작업 실행
+    # 작업 실행 (프로세스 생성 없이 직접 호출, 서로 독립적인 API 호출은 동시 실행)
+    task_results = asyncio.run(run_generation_tasks_concurrently(tasks))
+    
     success_count = 0
-    for task in tasks:
+    for task, result in zip(tasks, task_results):
         artifact_type = task["type"]
-        result = run_generation_command(task["cmd"], artifact_type)
         
         if result["success"]:
             success_count += 1
@@ -296,24 +411,21 @@ def generate_all(input_path: str, item_type: str, out_dir: Optional[str] = None)
                     dst_file = artifact_dir / "desc_v1.md"
                     shutil.move(str(src_file), str(dst_file))
             else:
-                # 이미지 파일 찾기 (2:3 또는 3:4 비율)
+                # 이미지 파일 찾기 (2:3 또는 3:4 비율, 디렉토리 1회 스캔)
                 if artifact_type == "closeup":
                     # closeup은 wear_closeup_2x3_01.png 형태로 생성됨
-                    image_files = list(artifact_dir.glob("wear_closeup_*x*_*.png"))
-                elif artifact_type.startswith("styled"):
-                    # styled, styled2, styled3 모두 동일한 패턴
-                    image_files = list(artifact_dir.glob("*_2x3_*.png")) + list(artifact_dir.glob("*_3x4_*.png"))
+                    image_files = find_output_images(artifact_dir, CLOSEUP_IMAGE_RE)
                 else:
-                    # 일반적인 패턴
-                    image_files = list(artifact_dir.glob("*_2x3_*.png")) + list(artifact_dir.glob("*_3x4_*.png"))
+                    # styled, styled2, styled3, wear 모두 동일한 패턴
+                    image_files = find_output_images(artifact_dir, OUTPUT_IMAGE_RE)
                 
                 if image_files:
                     src_file = image_files[0]
                     dst_file = artifact_dir / f"{artifact_type}_v1.png"
                     shutil.move(str(src_file), str(dst_file))
             
-            update_meta_json(meta_path, artifact_type, 1, 
-                           {}, True)
+            meta = update_meta_json(meta_path, artifact_type, 1, 
+                                    {}, True, meta=meta, save=False, timestamp=now_iso)
         else:
             results["errors"].append({
                 "artifact": artifact_type,
@@ -321,22 +433,17 @@ def generate_all(input_path: str, item_type: str, out_dir: Optional[str] = None)
             })
             
             # meta.json에 에러 기록
-            if artifact_type in ["desc", "styled", "wear", "closeup", "styled2", "styled3"]:
-                update_meta_json(meta_path, artifact_type, 1, 
-                               {}, False, 
-                               result.get("error"))
-    
-    # 최종 상태 업데이트
-    with open(meta_path, 'r', encoding='utf-8') as f:
-        final_meta = json.load(f)
+            if artifact_type in META_ARTIFACT_KEYS:
+                meta = update_meta_json(meta_path, artifact_type, 1, 
+                                        {}, False, 
+                                        result.get("error"), meta=meta, save=False, timestamp=now_iso)
     
-    final_meta["status"] = "done" if success_count == len(tasks) else "partial"
-    final_meta["completed_at"] = datetime.now().isoformat()
+    # 최종 상태 업데이트 (메모리 상의 meta를 한 번만 저장)
+    meta["status"] = "done" if success_count == len(tasks) else "partial"
+    meta["completed_at"] = datetime.now().isoformat(timespec='seconds')
+    write_json_atomic(meta_path, meta)
     
-    with open(meta_path, 'w', encoding='utf-8') as f:
-        json.dump(final_meta, f, indent=2, ensure_ascii=False)
-    
-    results["status"] = final_meta["status"]
+    results["status"] = meta["status"]
     results["total_tasks"] = len(tasks)
     results["success_count"] = success_count
     
@@ -346,6 +453,67 @@ def generate_all(input_path: str, item_type: str, out_dir: Optional[str] = None)
     return results
 
 
+def export_job(job_id: str, export_dir: str) -> Dict[str, Any]:
+    """Job의 최신 버전 산출물을 export 폴더로 복사하고 manifest 반환"""
+    job_dir = Path("out") / job_id
+    if not job_dir.exists():
+        raise FileNotFoundError(f"Job not found: {job_id}")
+    
+    # meta.json 읽기
+    meta_path = job_dir / "meta.json"
+    if not meta_path.exists():
+        raise FileNotFoundError("meta.json not found")
+    
+    meta = read_json(meta_path)
+    
+    # export 디렉토리 생성
+    export_path = Path(export_dir)
+    export_path.mkdir(parents=True, exist_ok=True)
+    
+    # 각 artifact의 최신 버전 복사
+    exported = []
+    
+    for artifact_type in ["desc", "styled", "wear", "closeup"]:
+        artifact_info = meta["artifacts"].get(artifact_type, {})
+        if artifact_info.get("latest", 0) > 0:
+            # 최신 파일 찾기
+            latest_file = job_dir / artifact_type / (
+                f"{artifact_type}.md" if artifact_type == "desc" else f"{artifact_type}.png"
+            )
+            
+            if latest_file.exists() or latest_file.is_symlink():
+                # 실제 파일 경로 가져오기 (심볼릭 링크 해결)
+                real_file = latest_file.resolve()
+                
+                # export 경로
+                if artifact_type == "desc":
+                    export_file = export_path / "description.md"
+                else:
+                    export_file = export_path / f"{artifact_type}.png"
+                
+                # 복사
+                shutil.copy2(real_file, export_file)
+                exported.append({
+                    "type": artifact_type,
+                    "source": str(latest_file),
+                    "destination": str(export_file)
+                })
+                
+                logger.info(f"Exported {artifact_type} -> {export_file}")
+    
+    # manifest.json 생성
+    manifest = {
+        "job_id": meta["job_id"],
+        "item_type": meta["type"],
+        "exported_at": datetime.now().isoformat(),
+        "source_job": str(job_dir),
+        "artifacts": exported
+    }
+    
+    manifest_path = export_path / "manifest.json"
+    write_json_atomic(manifest_path, manifest, pretty=True)
+    
+    return {"success": True, "export_dir": str(export_path), "manifest_path": str(manifest_path), "manifest": manifest}
 
 
 if __name__ == "__main__":
@@ -2,14 +2,14 @@
 공통 오케스트레이션 모듈
 입력 검증, 출력 폴더 생성, 각 작업별 처리 함수
 """
-import json
+import functools
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Tuple
 
 from .config import get_config
-from .io_utils import create_output_dir, validate_image_path
+from .io_utils import create_output_dir, validate_image_path, write_json_atomic
 from .text_gen import generate_description
 from .image_gen import (
     generate_thumbnail,
@@ -44,133 +44,56 @@ def create_metadata(
 def save_metadata(metadata: Dict[str, Any], output_dir: Path) -> None:
     """메타데이터 저장"""
     meta_path = output_dir / "meta.json"
-    with open(meta_path, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
+    write_json_atomic(meta_path, metadata)
     logger.info(f"메타데이터 저장: {meta_path}")
 
 
-def process_description(
-    image_path: str,
-    jewelry_type: str,
-    output_dir: str = None
-) -> Path:
-    """상품 설명 생성 처리"""
-    # 입력 검증
-    img_path = validate_image_path(image_path)
-    
-    # 출력 디렉토리 생성
-    out_dir = create_output_dir(output_dir, "desc")
-    
-    # 메타데이터 생성
-    metadata = create_metadata(image_path, jewelry_type, out_dir, "description")
-    
-    try:
-        # 설명 생성
-        logger.info(f"상품 설명 생성 시작: {img_path}")
-        description = generate_description(img_path, jewelry_type)
-        
-        # 결과 저장
-        desc_path = out_dir / "desc.md"
-        with open(desc_path, 'w', encoding='utf-8') as f:
-            f.write(description)
-        
-        logger.info(f"상품 설명 저장: {desc_path}")
-        
-        # 메타데이터 저장
-        save_metadata(metadata, out_dir)
-        
-        return out_dir
-        
-    except Exception as e:
-        logger.error(f"상품 설명 생성 실패: {e}")
-        raise
+def _generate_description_file(image_path: Path, jewelry_type: str, output_dir: Path) -> Path:
+    """상품 설명 생성 후 desc.md로 저장"""
+    description = generate_description(image_path, jewelry_type)
+    desc_path = output_dir / "desc.md"
+    # desc.md가 이전 버전을 가리키는 링크일 수 있으므로 제거 후 새로 작성
+    desc_path.unlink(missing_ok=True)
+    desc_path.write_text(description, encoding='utf-8')
+    return desc_path
 
 
-def process_thumbnail(
-    image_path: str,
-    jewelry_type: str,
-    output_dir: str = None
-) -> Path:
-    """누끼컷 생성 처리"""
-    # 입력 검증
-    img_path = validate_image_path(image_path)
-    
-    # 출력 디렉토리 생성
-    out_dir = create_output_dir(output_dir, "thumb")
-    
-    # 메타데이터 생성
-    metadata = create_metadata(image_path, jewelry_type, out_dir, "thumbnail")
-    
-    try:
-        # 누끼컷 생성
-        logger.info(f"누끼컷 생성 시작: {img_path}")
-        thumb_path = generate_thumbnail(img_path, jewelry_type, out_dir)
-        
-        logger.info(f"누끼컷 저장: {thumb_path}")
-        
-        # 메타데이터 저장
-        save_metadata(metadata, out_dir)
-        
-        return out_dir
-        
-    except Exception as e:
-        logger.error(f"누끼컷 생성 실패: {e}")
-        raise
+# 작업별 (출력 폴더 접두어, 메타데이터 task 이름, 표시 이름, 생성 함수)
+TASKS: Dict[str, Tuple[str, str, str, Callable[[Path, str, Path], Any]]] = {
+    "desc": ("desc", "description", "상품 설명", _generate_description_file),
+    "thumb": ("thumb", "thumbnail", "누끼컷", generate_thumbnail),
+    "styled": ("styled", "styled_shot", "제품 연출컷", generate_styled_shot),
+    "wear": ("wear", "wear_shot", "착용컷", generate_wear_shot),
+    "wear_closeup": ("wear_closeup", "wear_closeup", "클로즈업 착용컷", generate_wear_closeup),
+}
 
 
-def process_styled(
+def process(
+    task_key: str,
     image_path: str,
     jewelry_type: str,
     output_dir: str = None
 ) -> Path:
-    """제품 연출컷 생성 처리"""
-    # 입력 검증
-    img_path = validate_image_path(image_path)
-    
-    # 출력 디렉토리 생성
-    out_dir = create_output_dir(output_dir, "styled")
-    
-    # 메타데이터 생성
-    metadata = create_metadata(image_path, jewelry_type, out_dir, "styled_shot")
+    """작업 종류에 따른 생성 처리 (입력 검증 → 출력 폴더 → 생성 → 메타데이터 저장)"""
+    slug, task_name, label, generate = TASKS[task_key]
     
-    try:
-        # 연출컷 생성
-        logger.info(f"제품 연출컷 생성 시작: {img_path}")
-        styled_paths = generate_styled_shot(img_path, jewelry_type, out_dir)
-        
-        logger.info(f"연출컷 저장: {len(styled_paths)}개")
-        
-        # 메타데이터 저장
-        save_metadata(metadata, out_dir)
-        
-        return out_dir
-        
-    except Exception as e:
-        logger.error(f"제품 연출컷 생성 실패: {e}")
-        raise
-
-
-def process_wear(
-    image_path: str,
-    jewelry_type: str,
-    output_dir: str = None
-) -> Path:
-    """착용컷 생성 처리"""
     # 입력 검증
     img_path = validate_image_path(image_path)
     
     # 출력 디렉토리 생성
-    out_dir = create_output_dir(output_dir, "wear")
+    out_dir = create_output_dir(output_dir, slug)
     
     # 메타데이터 생성
-    metadata = create_metadata(image_path, jewelry_type, out_dir, "wear_shot")
+    metadata = create_metadata(image_path, jewelry_type, out_dir, task_name)
     
     try:
-        # 착용컷 생성
-        logger.info(f"착용컷 생성 시작: {img_path}")
-        wear_paths = generate_wear_shot(img_path, jewelry_type, out_dir)
+        logger.info(f"{label} 생성 시작: {img_path}")
+        result = generate(img_path, jewelry_type, out_dir)
         
-        logger.info(f"착용컷 저장: {len(wear_paths)}개")
+        if isinstance(result, list):
+            logger.info(f"{label} 저장: {len(result)}개")
+        else:
+            logger.info(f"{label} 저장: {result}")
         
         # 메타데이터 저장
         save_metadata(metadata, out_dir)
@@ -178,37 +101,13 @@ def process_wear(
         return out_dir
         
     except Exception as e:
-        logger.error(f"착용컷 생성 실패: {e}")
+        logger.error(f"{label} 생성 실패: {e}")
         raise
 
 
-def process_wear_closeup(
-    image_path: str,
-    jewelry_type: str,
-    output_dir: str = None
-) -> Path:
-    """클로즈업 착용컷 생성 처리"""
-    # 입력 검증
-    img_path = validate_image_path(image_path)
-    
-    # 출력 디렉토리 생성
-    out_dir = create_output_dir(output_dir, "wear_closeup")
-    
-    # 메타데이터 생성
-    metadata = create_metadata(image_path, jewelry_type, out_dir, "wear_closeup")
-    
-    try:
-        # 클로즈업 착용컷 생성
-        logger.info(f"클로즈업 착용컷 생성 시작: {img_path}")
-        closeup_paths = generate_wear_closeup(img_path, jewelry_type, out_dir)
-        
-        logger.info(f"클로즈업 착용컷 저장: {len(closeup_paths)}개")
-        
-        # 메타데이터 저장
-        save_metadata(metadata, out_dir)
-        
-        return out_dir
-        
-    except Exception as e:
-        logger.error(f"클로즈업 착용컷 생성 실패: {e}")
-        raise
\ No newline at end of file
+# 기존 API 호환용 작업별 함수
+process_description = functools.partial(process, "desc")
+process_thumbnail = functools.partial(process, "thumb")
+process_styled = functools.partial(process, "styled")
+process_wear = functools.partial(process, "wear")
+process_wear_closeup = functools.partial(process, "wear_closeup")
@@ -2,17 +2,71 @@
 텍스트 생성 래퍼 모듈
 OpenAI API를 사용한 텍스트 생성
 """
+import base64
+import functools
 import logging
+import threading
 from pathlib import Path
+from typing import Optional, Tuple
 
+import httpx
 import openai
 
-from .config import get_config
+from .config import API_MAX_RETRIES, API_TIMEOUT_IMAGE, API_TIMEOUT_TEXT, get_config
 from .config_manager import config_manager
 
 
 logger = logging.getLogger(__name__)
 
+# 공유 OpenAI 클라이언트 (HTTP 연결 풀 재사용)
+_client: Optional[openai.Client] = None
+# 이미지 생성용 클라이언트 (같은 연결 풀, 재시도 없음)
+_image_client: Optional[openai.Client] = None
+_client_api_key: Optional[str] = None
+_client_lock = threading.Lock()
+
+
+def _get_clients() -> Tuple[openai.Client, openai.Client]:
+    """공유 (기본, 이미지용) 클라이언트 쌍 반환 (API 키가 바뀌면 새로 생성)"""
+    global _client, _image_client, _client_api_key
+    api_key = get_config().OPENAI_API_KEY
+    with _client_lock:
+        if _client is None or _client_api_key != api_key:
+            # 이전 키의 클라이언트는 닫지 않음 - 다른 스레드에서 진행 중인 요청이 끝나면 GC로 정리
+            # openai 클라이언트 내장 재시도는 429/5xx/타임아웃에 지수 백오프(지터 포함) 적용
+            _client = openai.Client(
+                api_key=api_key,
+                timeout=API_TIMEOUT_IMAGE,
+                max_retries=API_MAX_RETRIES,
+                http_client=openai.DefaultHttpxClient(
+                    limits=httpx.Limits(max_connections=16, max_keepalive_connections=16)
+                )
+            )
+            # 이미지 생성은 타임아웃 후 재전송하면 중복 과금되고 파일당 제한 시간을 넘기므로 재시도하지 않음
+            _image_client = _client.with_options(max_retries=0)
+            _client_api_key = api_key
+        return _client, _image_client
+
+
+def get_client() -> openai.Client:
+    """공유 OpenAI 클라이언트 반환 (API 키가 바뀌면 새로 생성)"""
+    return _get_clients()[0]
+
+
+def get_image_client() -> openai.Client:
+    """이미지 생성용 공유 클라이언트 반환 (재시도 없음)"""
+    return _get_clients()[1]
+
+
+@functools.lru_cache(maxsize=32)
+def _read_prompt_raw(prompt_name: str) -> Optional[str]:
+    """기본 프롬프트 파일 원문 로드 (캐시, 파일이 없으면 None)"""
+    prompt_path = Path(__file__).parent / "prompts" / f"{prompt_name}.md"
+    if not prompt_path.exists():
+        logger.error(f"프롬프트 파일을 찾을 수 없음: {prompt_path}")
+        return None
+    return prompt_path.read_text(encoding='utf-8')
+
 
 def load_prompt(prompt_name: str, jewelry_type: str) -> str:
     """프롬프트 파일 로드 및 변수 치환"""
@@ -24,26 +78,25 @@ def load_prompt(prompt_name: str, jewelry_type: str) -> str:
     except Exception as e:
         logger.warning(f"프롬프트 설정 로드 실패, 기본 파일로 대체: {e}")
     
-    # 기존 파일 시스템으로 폴백
-    prompt_path = Path(__file__).parent / "prompts" / f"{prompt_name}.md"
-    
-    if prompt_path.exists():
-        with open(prompt_path, 'r', encoding='utf-8') as f:
-            prompt = f.read()
-        
-        # 주얼리 종류 치환
-        prompt = prompt.replace("{JEWELRY_TYPE}", jewelry_type)
-        
-        return prompt
-    else:
-        logger.error(f"프롬프트 파일을 찾을 수 없음: {prompt_path}")
+    # 기존 파일 시스템으로 폴백 (파일 원문은 캐시됨)
+    prompt = _read_prompt_raw(prompt_name)
+    if prompt is None:
         return f"# {jewelry_type} {prompt_name}"
+    
+    # 주얼리 종류 치환
+    return prompt.replace("{JEWELRY_TYPE}", jewelry_type)
+
+
+def encode_image_data_url(image_path: Path) -> str:
+    """이미지를 base64 data URL로 인코딩"""
+    encoded = base64.b64encode(Path(image_path).read_bytes()).decode('ascii')
+    return f"data:image/jpeg;base64,{encoded}"
 
 
 def generate_description(image_path: Path, jewelry_type: str) -> str:
     """상품 설명 생성"""
     config = get_config()
-    client = openai.Client(api_key=config.OPENAI_API_KEY)
+    client = get_client()
     
     # 프롬프트 로드
     prompt = load_prompt("desc", jewelry_type)
@@ -52,9 +105,7 @@ def generate_description(image_path: Path, jewelry_type: str) -> str:
     
     try:
         # 이미지를 base64로 인코딩
-        import base64
-        with open(image_path, "rb") as image_file:
-            base64_image = base64.b64encode(image_file.read()).decode('utf-8')
+        image_url = encode_image_data_url(image_path)
         
         # OpenAI API 호출
         response = client.chat.completions.create(
@@ -70,14 +121,15 @@ def generate_description(image_path: Path, jewelry_type: str) -> str:
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:image/jpeg;base64,{base64_image}"
+                                "url": image_url
                             }
                         }
                     ]
                 }
             ],
             max_tokens=1000,
-            temperature=0.7
+            temperature=0.7,
+            timeout=API_TIMEOUT_TEXT
         )
         
         description = response.choices[0].message.content
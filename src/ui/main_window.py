@@ -3,66 +3,328 @@
 주얼리 생성 시스템 메인 UI
 """
 import json
+import logging
+import queue
+import shutil
+import stat
 import sys
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from PySide6.QtCore import Qt, QThread, Signal, QTimer, QSize
-from PySide6.QtGui import QPixmap, QAction, QIcon, QCursor
+from PySide6.QtCore import (
+    Qt, QThread, Signal, QTimer, QSize, QAbstractTableModel, QModelIndex,
+    QRegularExpression, QSortFilterProxyModel, QFileSystemWatcher, QDeadlineTimer, QUrl,
+    QElapsedTimer,
+)
+from PySide6.QtGui import (
+    QBrush, QPixmap, QPixmapCache, QImageReader, QAction, QIcon, QCursor, QDesktopServices,
+)
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTableWidget, QTableWidgetItem, QLabel, QPushButton, QSplitter,
+    QTableView, QAbstractItemView, QLabel, QPushButton, QSplitter,
     QGroupBox, QGridLayout, QTextEdit, QFileDialog, QMessageBox,
     QHeaderView, QProgressBar, QToolBar, QComboBox, QSpinBox,
     QDialog, QDialogButtonBox, QFormLayout, QLineEdit, QScrollArea,
-    QCheckBox, QTabWidget, QSizePolicy
+    QCheckBox, QTabWidget, QSizePolicy, QStackedWidget
 )
 
 # 프로젝트 루트 경로 설정
 import os
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
 
-from src.pipeline import generate_all
-from src.batch_processor import BatchProcessor, process_inbox_folders
+from src import processor
+from src.pipeline import (
+    generate_all, export_job as export_job_files, resize_image, find_output_images, OUTPUT_IMAGE_RE, CLOSEUP_IMAGE_RE,
+    STANDARD_JEWELRY_TYPES,
+)
+from src.io_utils import loads_json, peek_json_bytes, peek_json_fields, read_json, write_json_atomic
+from src.batch_processor import BatchProcessor, get_image_files, process_inbox_folders
 from src.config_manager import config_manager
-from src.ui.settings_dialog import SettingsDialog, FirstRunDialog
+
+logger = logging.getLogger(__name__)
+
+# 미리보기 이미지 캐시 크기 (KB)
+QPixmapCache.setCacheLimit(32 * 1024)
+
+# 폴더 선택 다이얼로그 옵션 (네이티브 다이얼로그, 폴더만 표시, 폴더별 아이콘 조회 생략)
+_DIR_DIALOG_OPTIONS = QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontUseCustomDirectoryIcons
+
+# 대시보드 자동 새로고침 주기 (ms)
+REFRESH_INTERVAL_MS = 5000
+# 폴더 감시 중 보조 새로고침 주기 (ms, 감시되지 않는 out/<job>/meta.json 외부 변경 반영용)
+REFRESH_INTERVAL_WATCHED_MS = 30000
+# 폴더 변경 알림 후 스캔까지 대기 (ms, 연속 변경은 한 번으로 묶음)
+FS_CHANGE_DEBOUNCE_MS = 300
+# Job 상태 저장 후 대시보드 갱신 알림 최소 간격 (초, 1Hz)
+META_DIRTY_INTERVAL = 1.0
+# Job 목록 새로고침 요청을 묶는 간격 (ms, 배치 중 연속 완료 시 한 번만 다시 읽음)
+JOB_RELOAD_COALESCE_MS = 200
+# 배치 진행 상태바 메시지 최소 갱신 간격 (ms, 10Hz)
+BATCH_STATUS_THROTTLE_MS = 100
+# 종료 대기 중 스레드 완료 여부를 확인하는 간격 (ms)
+CLOSE_RETRY_INTERVAL_MS = 200
+# meta.json 읽기-수정-쓰기 직렬화 (재생성 버전 기록과 상태 저장 스레드 간 변경 유실 방지)
+META_WRITE_LOCK = threading.Lock()
+# 배치 진행 메시지 템플릿 (format 메서드를 미리 바인딩)
+_BATCH_PROGRESS_TYPED = "처리 중... ({}/{}) - {} ({})".format
+_BATCH_PROGRESS_PLAIN = "처리 중... ({}/{}) - {}".format
+# 상태 필터 콤보 변경 후 적용까지 대기 (ms, 키보드로 빠르게 넘길 때 마지막 값만 적용)
+FILTER_DEBOUNCE_MS = 150
+# meta.json 병렬 로드 스레드 수 (디스크/네트워크 드라이브 대기 중첩)
+META_SCAN_WORKERS = 8
+
+# 주얼리 타입별 미리보기 산출물과 라벨 (표시 순서 유지)
+STANDARD_PREVIEW_LABELS = {"styled": "연출컷", "wear": "착용컷", "closeup": "클로즈업"}
+EXTRA_PREVIEW_LABELS = {"styled": "연출컷 1", "styled2": "연출컷 2", "styled3": "연출컷 3"}
+
+# Job 목록에 표시하는 meta.json 최상위 필드
+META_SUMMARY_KEYS = ("type", "status", "created_at", "src_name")
+
+# 테이블 컬럼 정의: (헤더, 행 dict 키, 폭) - 마지막 컬럼은 남은 폭을 채움
+JOB_COLUMNS = (
+    ("Job ID", "job_id", 120),
+    ("종류", "type", 80),
+    ("상태", "status", 90),
+    ("생성일", "created_at_short", 150),
+    ("파일명", "src_name", 0),
+)
+COMPLETED_COLUMNS = JOB_COLUMNS[:4]
+INBOX_COLUMNS = (("종류", "type", 80), ("파일명", "name", 200), ("경로", "path", 0))
+
+# 상태별 배경 브러시 (재처리 중은 하늘색) - 셀마다 새로 만들지 않도록 미리 생성
+STATUS_BRUSHES = {
+    "done": QBrush(Qt.green),
+    "partial": QBrush(Qt.yellow),
+    "failed": QBrush(Qt.red),
+    "reprocessing": QBrush(Qt.cyan),
+}
+
+# 일괄 생성 다이얼로그 버튼 스타일 (다이얼로그마다 문자열을 새로 만들지 않도록 모듈 상수로 유지)
+_OK_BUTTON_STYLE = """
+QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #4CAF50, stop:1 #45a049);
+    color: white;
+    border: none;
+    border-radius: 6px;
+    padding: 8px 20px;
+    font-weight: bold;
+    font-size: 12px;
+    min-width: 120px;
+}
+QPushButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #5CBF60, stop:1 #4CAF50);
+}
+QPushButton:pressed {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #45a049, stop:1 #3d8b40);
+}
+"""
+
+_CANCEL_BUTTON_STYLE = """
+QPushButton {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #f44336, stop:1 #da190b);
+    color: white;
+    border: none;
+    border-radius: 6px;
+    padding: 8px 20px;
+    font-weight: bold;
+    font-size: 12px;
+    min-width: 80px;
+}
+QPushButton:hover {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #f66356, stop:1 #f44336);
+}
+QPushButton:pressed {
+    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+        stop:0 #da190b, stop:1 #c62828);
+}
+"""
+
+
+@dataclass(frozen=True)
+class ArtifactPaths:
+    """산출물 미리보기 경로 (Job 단위로 한 번만 계산)"""
+    preview: Path  # 최신 버전 링크 (예: styled/styled.png)
+    dir: Path  # 산출물 폴더
+
+
+class RecordTableModel(QAbstractTableModel):
+    """dict 목록을 그대로 보관하는 읽기 전용 테이블 모델 (셀 위젯 생성 없이 보이는 행만 그림)"""
+    def __init__(self, columns, parent=None, id_key: Optional[str] = None):
+        super().__init__(parent)
+        self._headers = [column[0] for column in columns]
+        self._keys = [column[1] for column in columns]
+        # 행 식별 키 (기본: 첫 번째 컬럼)
+        self._id_key = id_key or self._keys[0]
+        self._rows: List[dict] = []
+    
+    def rows(self) -> List[dict]:
+        return self._rows
+    
+    def set_rows(self, rows: List[dict]):
+        """전체 데이터 교체 (행 구성이 같으면 기존 행을 재사용해 값만 갱신)"""
+        id_key = self._id_key
+        if rows and len(rows) == len(self._rows) and all(
+            new.get(id_key) == old.get(id_key) for new, old in zip(rows, self._rows)
+        ):
+            # 같은 행 구성이면 리셋 없이 dataChanged만 알려 뷰의 선택/스크롤/행 배치를 유지
+            self._rows = rows
+            self.dataChanged.emit(self.index(0, 0), self.index(len(rows) - 1, len(self._keys) - 1))
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._keys)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        key = self._keys[index.column()]
+        if role == Qt.DisplayRole:
+            return str(self._rows[index.row()].get(key, ""))
+        if role == Qt.BackgroundRole and key == "status":
+            return STATUS_BRUSHES.get(self._rows[index.row()].get("status"))
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+
+def iter_subdirs(directory: Path):
+    """하위 폴더 항목 순회 (os.scandir로 디렉토리 읽기 결과의 타입 정보 사용)"""
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir():
+                yield entry
+
+
+def create_record_table(columns, on_selected=None, id_key: Optional[str] = None) -> QTableView:
+    """RecordTableModel + 상태 필터 프록시를 연결한 행 선택 테이블 뷰 생성"""
+    table = QTableView()
+    source = RecordTableModel(columns, table, id_key)
+    proxy = QSortFilterProxyModel(table)
+    proxy.setSourceModel(source)
+    keys = [column[1] for column in columns]
+    if "status" in keys:
+        proxy.setFilterKeyColumn(keys.index("status"))
+    table.setModel(proxy)
+    
+    # 컬럼 폭을 고정값으로 지정해 데이터 기반 폭 계산을 피함 (사용자 조절은 허용)
+    header = table.horizontalHeader()
+    header.setSectionResizeMode(QHeaderView.Interactive)
+    for col, (_, _, width) in enumerate(columns[:-1]):
+        table.setColumnWidth(col, width)
+    header.setStretchLastSection(True)
+    # 행 높이도 내용과 무관하게 고정
+    table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+    table.setSelectionBehavior(QAbstractItemView.SelectRows)
+    if on_selected is not None:
+        # selectionModel은 setModel 이후에 생성됨
+        table.selectionModel().selectionChanged.connect(on_selected)
+    return table
+
+
+def record_model(table: QTableView) -> RecordTableModel:
+    """테이블 뷰의 원본 데이터 모델 반환"""
+    return table.model().sourceModel()
+
+
+def apply_status_filter(table: QTableView, status: str):
+    """상태 컬럼 기준 필터링 (프록시 모델이 C++에서 행을 걸러냄)"""
+    # "processing"이 "reprocessing"에 부분 일치하지 않도록 전체 일치 패턴 사용
+    pattern = "" if status == "전체" else f"^{QRegularExpression.escape(status)}$"
+    table.model().setFilterRegularExpression(pattern)
+
+
+def selected_record(table: QTableView) -> Optional[dict]:
+    """현재 선택된 행의 데이터 반환"""
+    index = table.currentIndex()
+    if not index.isValid():
+        return None
+    row = table.model().mapToSource(index).row()
+    rows = record_model(table).rows()
+    return rows[row] if 0 <= row < len(rows) else None
 
 
 class ClickableImageLabel(QLabel):
     """클릭 가능한 이미지 라벨"""
+    # 빈 상태에서 공유하는 빈 QPixmap (QApplication 생성 후 최초 인스턴스에서 할당)
+    _EMPTY = None
+    
     def __init__(self):
         super().__init__()
+        if type(self)._EMPTY is None:
+            type(self)._EMPTY = QPixmap()
         self.image_path = None
+        # 현재 표시 중인 이미지 캐시 키 ("": 빈 상태, None: 아직 설정 안 됨)
+        self._shown_key = None
         self.setCursor(QCursor(Qt.PointingHandCursor))
         self.setStyleSheet("border: 1px solid #ccc;")
         
     def set_image(self, image_path: str):
-        """이미지 설정"""
+        """이미지 설정 (디코딩/스케일 결과는 QPixmapCache에 캐시)"""
         self.image_path = image_path
-        if Path(image_path).exists():
-            pixmap = QPixmap(image_path)
-            self.setPixmap(pixmap.scaled(200, 300, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        else:
+        try:
+            # 존재 여부/파일 여부/수정 시각을 stat 1회로 확인
+            st = os.stat(image_path) if image_path else None
+        except OSError:
+            st = None
+        if st is not None and stat.S_ISREG(st.st_mode):
+            # 파일 수정 시각을 키에 포함해 재생성된 이미지는 새로 로드
+            key = f"{image_path}:{st.st_mtime}:200x300"
+            if key == self._shown_key:
+                # 같은 이미지가 이미 표시 중이면 다시 그리지 않음
+                return
+            pixmap = QPixmapCache.find(key)
+            if pixmap is None or pixmap.isNull():
+                # 2단계 스케일: 디코딩 시 목표의 2배 크기로 빠르게 축소한 뒤 작은 이미지만 부드럽게 축소
+                reader = QImageReader(image_path)
+                reader.setAutoTransform(True)
+                size = reader.size()
+                if size.isValid():
+                    if size.width() > 400 or size.height() > 600:
+                        size.scale(400, 600, Qt.KeepAspectRatio)
+                        reader.setScaledSize(size)
+                    image = reader.read()
+                else:
+                    image = QPixmap(image_path).scaled(400, 600, Qt.KeepAspectRatio, Qt.FastTransformation).toImage()
+                pixmap = QPixmap.fromImage(image.scaled(200, 300, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+                QPixmapCache.insert(key, pixmap)
+            self.setPixmap(pixmap)
+            self._shown_key = key
+        elif self._shown_key != "":
+            # 이미 빈 상태면 갱신하지 않음 (불필요한 repaint 방지)
+            self.setPixmap(self._EMPTY)
+            # setPixmap이 텍스트를 지우므로 안내 문구는 그 다음에 설정
             self.setText("(생성되지 않음)")
-            self.setPixmap(QPixmap())
+            self._shown_key = ""
     
     def mousePressEvent(self, event):
         """이미지 클릭 시 OS 기본 뷰어로 열기"""
         if event.button() == Qt.LeftButton and self.image_path and Path(self.image_path).exists():
-            import subprocess
-            import platform
-            
-            system = platform.system()
-            try:
-                if system == "Darwin":  # macOS
-                    subprocess.run(["open", self.image_path])
-                elif system == "Windows":
-                    subprocess.run(["start", self.image_path], shell=True)
-                else:  # Linux
-                    subprocess.run(["xdg-open", self.image_path])
-            except Exception as e:
-                print(f"Failed to open image: {e}")
+            # OS 셸 API로 직접 열기 (프로세스 생성 없음, 뷰어 종료를 기다리지 않음)
+            if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(self.image_path))):
+                print(f"Failed to open image: {self.image_path}")
 
 
 
@@ -77,104 +339,30 @@ class GenerationThread(QThread):
         super().__init__()
         self.task_type = task_type
         self.kwargs = kwargs
+        # 최신 버전 링크 갱신은 meta.json 저장 시점에 함께 처리
+        self._pending_links = []
     
     def run(self):
         try:
             if self.task_type == "generate_all":
                 result = generate_all(**self.kwargs)
                 self.finished.emit(result)
-            elif self.task_type == "regenerate_cli":
-                # CLI 모듈 직접 호출 (기존 방식)
-                result = self._run_cli_regenerate()
+            elif self.task_type == "export":
+                result = export_job_files(**self.kwargs)
                 self.finished.emit(result)
-            elif self.task_type == "regenerate_direct":
-                # 직접 재생성 (병렬처리 최적화)
+            elif self.task_type in ("regenerate_cli", "regenerate_direct"):
+                # 직접 재생성 (CLI 프로세스 없이 내부 모듈 호출)
                 result = self._run_direct_regenerate()
                 self.finished.emit(result)
         except Exception as e:
             self.error.emit(str(e))
     
-    def _run_cli_regenerate(self):
-        """CLI 모듈을 직접 호출하여 재생성"""
-        import subprocess
-        
-        job_id = self.kwargs["job_id"]
-        artifact = self.kwargs["artifact"]
-        
-        # job 정보 읽기
-        import json
-        from pathlib import Path
-        
-        job_dir = Path("out") / job_id
-        meta_path = job_dir / "meta.json"
-        
-        if not meta_path.exists():
-            return {"success": False, "error": "Job meta.json not found"}
-        
-        with open(meta_path, 'r', encoding='utf-8') as f:
-            meta = json.load(f)
-        
-        # work 이미지 준비
-        work_dir = Path("work") / job_id
-        work_image = work_dir / "input.png"
-        
-        if not work_image.exists():
-            # 원본에서 다시 생성
-            from src.pipeline import resize_image
-            import shutil
-            
-            original_path = Path(meta.get("input_path", ""))
-            if original_path.exists():
-                work_dir.mkdir(parents=True, exist_ok=True)
-                resized_path = resize_image(original_path)
-                shutil.copy2(resized_path, work_image)
-            else:
-                return {"success": False, "error": "Original input image not found"}
-        
-        # CLI 명령 구성
-        cmd = None
-        if artifact == "desc":
-            cmd = [sys.executable, "-m", "src.cli_desc", "--image", str(work_image), "--type", meta["type"], "--out", str(job_dir / "desc")]
-        elif artifact == "styled":
-            cmd = [sys.executable, "-m", "src.cli_styled", "--image", str(work_image), "--type", meta["type"], "--out", str(job_dir / "styled")]
-        elif artifact in ["styled2", "styled3"]:
-            cmd = [sys.executable, "-m", "src.cli_styled", "--image", str(work_image), "--type", meta["type"], "--out", str(job_dir / artifact)]
-        elif artifact == "wear":
-            cmd = [sys.executable, "-m", "src.cli_wear", "--image", str(work_image), "--type", meta["type"], "--out", str(job_dir / "wear")]
-        elif artifact == "closeup":
-            cmd = [sys.executable, "-m", "src.cli_wear_closeup", "--image", str(work_image), "--type", meta["type"], "--out", str(job_dir / "closeup")]
-        
-        if not cmd:
-            return {"success": False, "error": f"Unknown artifact type: {artifact}"}
-        
-        # CLI 실행
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0:
-                # 성공 시 버전 정보 업데이트
-                self._update_version_info(job_id, artifact)
-                return {"success": True, "job_id": job_id, "artifact": artifact}
-            else:
-                return {"success": False, "error": result.stderr or "CLI execution failed"}
-        except Exception as e:
-            return {"success": False, "error": str(e)}
-    
-    def _update_version_info(self, job_id: str, artifact: str):
-        """버전 정보 업데이트"""
-        import json
-        import shutil
-        from pathlib import Path
-        from datetime import datetime
-        
+    def _update_version_info(self, job_id: str, artifact: str, meta: dict):
+        """버전 정보 업데이트 (메모리의 meta만 수정, 저장은 _flush_meta에서)"""
         job_dir = Path("out") / job_id
-        meta_path = job_dir / "meta.json"
-        
-        # meta.json 읽기
-        with open(meta_path, 'r', encoding='utf-8') as f:
-            meta = json.load(f)
         
         # 다음 버전 번호
-        artifact_info = meta["artifacts"].get(artifact, {"latest": 0, "versions": []})
+        artifact_info = meta["artifacts"].setdefault(artifact, {"latest": 0, "versions": []})
         next_version = len(artifact_info["versions"]) + 1
         
         # 생성된 파일을 버전 파일로 이동
@@ -184,14 +372,12 @@ class GenerationThread(QThread):
             src_file = artifact_dir / "desc.md"
             dst_file = artifact_dir / f"desc_v{next_version}.md"
         else:
-            # 이미지 파일 찾기
+            # 이미지 파일 찾기 (디렉토리 1회 스캔)
             if artifact == "closeup":
-                image_files = list(artifact_dir.glob("wear_closeup_*x*_*.png"))
-            elif artifact.startswith("styled"):
-                # styled, styled2, styled3 모두 동일한 패턴으로 찾기
-                image_files = list(artifact_dir.glob("*_2x3_*.png")) + list(artifact_dir.glob("*_3x4_*.png"))
+                image_files = find_output_images(artifact_dir, CLOSEUP_IMAGE_RE)
             else:
-                image_files = list(artifact_dir.glob("*_2x3_*.png")) + list(artifact_dir.glob("*_3x4_*.png"))
+                # styled, styled2, styled3, wear 모두 동일한 패턴으로 찾기
+                image_files = find_output_images(artifact_dir, OUTPUT_IMAGE_RE)
             
             if image_files:
                 src_file = image_files[0]
@@ -199,9 +385,11 @@ class GenerationThread(QThread):
             else:
                 return
         
-        # 파일 이동
-        if src_file.exists():
-            shutil.move(str(src_file), str(dst_file))
+        # 파일 이동 (같은 폴더 내 rename이므로 복사 없이 원자적으로 교체)
+        try:
+            os.replace(src_file, dst_file)
+        except FileNotFoundError:
+            pass
         
         # meta.json 업데이트
         version_info = {
@@ -214,15 +402,24 @@ class GenerationThread(QThread):
         artifact_info["versions"].append(version_info)
         artifact_info["latest"] = next_version
         
-        # 심볼릭 링크 생성/업데이트
+        # 심볼릭 링크 갱신은 meta 저장 시점으로 미룸
         latest_link = artifact_dir / (f"{artifact}.md" if artifact == "desc" else f"{artifact}.png")
-        if latest_link.exists() or latest_link.is_symlink():
-            latest_link.unlink()
-        latest_link.symlink_to(dst_file.relative_to(latest_link.parent))
+        self._pending_links.append((latest_link, dst_file.relative_to(latest_link.parent)))
+    
+    def _flush_meta(self, job_id: str, meta: dict):
+        """변경된 meta.json과 최신 버전 링크를 한 번에 저장"""
+        # 버전 파일을 찾지 못해 meta가 바뀌지 않았으면 저장하지 않음
+        if not self._pending_links:
+            return
         
-        # meta.json 저장
-        with open(meta_path, 'w', encoding='utf-8') as f:
-            json.dump(meta, f, indent=2, ensure_ascii=False)
+        # 심볼릭 링크 생성/업데이트
+        for latest_link, target in self._pending_links:
+            latest_link.unlink(missing_ok=True)
+            latest_link.symlink_to(target)
+        self._pending_links.clear()
+        
+        # meta.json 저장 (임시 파일 + os.replace)
+        write_json_atomic(Path("out") / job_id / "meta.json", meta)
     
     def _run_direct_regenerate(self):
         """직접 재생성 (병렬처리 최적화) - 내부 모듈 직접 호출"""
@@ -237,8 +434,8 @@ class GenerationThread(QThread):
             if not meta_path.exists():
                 return {"success": False, "error": "Job meta.json not found"}
             
-            with open(meta_path, 'r', encoding='utf-8') as f:
-                meta = json.load(f)
+            # 생성 전에는 필요한 최상위 필드만 읽음 (artifacts는 생성 후 다시 읽어 갱신)
+            meta = peek_json_fields(meta_path, ("type", "input_path"))
             
             # work 이미지 경로
             work_dir = Path("work") / job_id
@@ -246,49 +443,48 @@ class GenerationThread(QThread):
             
             if not work_image.exists():
                 # 원본에서 다시 생성
-                from src.pipeline import resize_image
-                import shutil
-                
                 original_path = Path(meta.get("input_path", ""))
                 if original_path.exists():
                     work_dir.mkdir(parents=True, exist_ok=True)
-                    resized_path = resize_image(original_path)
-                    shutil.copy2(resized_path, work_image)
+                    resize_image(original_path, out_path=work_image)
                 else:
                     return {"success": False, "error": "Original input image not found"}
             
+            # 종료 중이면 API 호출 시작 전에 중단
+            if self.isInterruptionRequested():
+                return {"success": False, "error": "Cancelled"}
+            
             # 직접 내부 모듈 호출 (subprocess 없이)
             jewelry_type = meta["type"]
             output_dir = job_dir / artifact
             
             if artifact == "desc":
-                from src.processor import process_description
-                result_dir = process_description(str(work_image), jewelry_type, str(output_dir))
+                result_dir = processor.process_description(str(work_image), jewelry_type, str(output_dir))
                 result = {"success": True, "output_dir": result_dir}
             elif artifact == "styled" or artifact.startswith("styled"):
-                from src.processor import process_styled
-                result_dir = process_styled(str(work_image), jewelry_type, str(output_dir))
+                result_dir = processor.process_styled(str(work_image), jewelry_type, str(output_dir))
                 result = {"success": True, "output_dir": result_dir}
             elif artifact == "wear":
-                from src.processor import process_wear
-                result_dir = process_wear(str(work_image), jewelry_type, str(output_dir))
+                result_dir = processor.process_wear(str(work_image), jewelry_type, str(output_dir))
                 result = {"success": True, "output_dir": result_dir}
             elif artifact == "closeup":
-                from src.processor import process_wear_closeup
-                result_dir = process_wear_closeup(str(work_image), jewelry_type, str(output_dir))
+                result_dir = processor.process_wear_closeup(str(work_image), jewelry_type, str(output_dir))
                 result = {"success": True, "output_dir": result_dir}
             else:
                 return {"success": False, "error": f"Unknown artifact type: {artifact}"}
             
             # 성공 시 버전 정보 업데이트
             if result.get("success", True) and result.get("output_dir"):
-                self._update_version_info(job_id, artifact)
+                # 생성 중 다른 재생성/상태 저장이 meta를 갱신했을 수 있으므로
+                # 읽기-수정-쓰기 전체를 잠금 안에서 최신 내용 기준으로 수행
+                with META_WRITE_LOCK:
+                    meta = read_json(meta_path)
+                    self._update_version_info(job_id, artifact, meta)
+                    self._flush_meta(job_id, meta)
                 return {"success": True, "job_id": job_id, "artifact": artifact}
             else:
                 return {"success": False, "error": result.get("error", "Generation failed")}
                 
-        except ImportError as e:
-            return {"success": False, "error": f"모듈 import 실패: {str(e)}"}
         except Exception as e:
             return {"success": False, "error": f"재생성 실패: {str(e)}"}
 
@@ -330,6 +526,9 @@ class BatchGenerationThread(QThread):
                     # 진행률 업데이트
                     stats = self.processor.get_stats()
                     self.progress.emit(stats["processed"], stats["total"], file_path.name, jewelry_type)
+                    
+                    if self.isInterruptionRequested():
+                        self.processor.cancel()
             else:
                 # 기존 방식: 단일 타입 처리
                 for file_path, result in self.processor.process_batch(self.files, self.jewelry_type):
@@ -343,6 +542,13 @@ class BatchGenerationThread(QThread):
                     # 진행률 업데이트
                     stats = self.processor.get_stats()
                     self.progress.emit(stats["processed"], stats["total"], file_path.name, self.jewelry_type)
+                    
+                    if self.isInterruptionRequested():
+                        self.processor.cancel()
+            
+            # 종료 중이면 자동 정리/완료 신호 생략
+            if self.isInterruptionRequested():
+                return
             
             # 자동 정리 수행
             if self.auto_archive and file_results:
@@ -355,43 +561,148 @@ class BatchGenerationThread(QThread):
         except Exception as e:
             self.error.emit(str(e))
     
+    def cancel(self):
+        """중단 요청 (완료 대기 중인 파일은 시작하지 않음)"""
+        self.requestInterruption()
+        if self.processor is not None:
+            self.processor.cancel()
+    
     def _auto_archive_files(self, file_results):
         """완전히 성공한 파일만 자동 정리"""
-        import shutil
-        from datetime import datetime
-        
         # 실행 ID 생성
         run_id = datetime.now().strftime("run_%Y%m%d_%H%M%S")
         
+        # 완전히 성공한 파일만 타입별로 모아서 archive로 이동
+        done_by_type: Dict[str, List[Path]] = {}
+        kept = []
         for file_path, (result, jewelry_type) in file_results.items():
-            if not file_path.exists():
-                continue  # 이미 이동된 파일은 스킵
-                
-            # 상태 확인
             status = result.get("status", "failed")
-            
-            # 완전히 성공한 파일만 archive로 이동
             if status == "done":
-                # 아카이브 디렉토리 생성
-                archive_dir = Path("archive/success") / run_id / jewelry_type
-                archive_dir.mkdir(parents=True, exist_ok=True)
-                
+                done_by_type.setdefault(jewelry_type, []).append(file_path)
+            else:
+                # partial/failed는 재생성/재시도를 위해 inbox에 그대로 유지
+                kept.append((file_path, status))
+        
+        archived = []
+        failed = []
+        for jewelry_type, paths in done_by_type.items():
+            # 아카이브 디렉토리는 타입별로 한 번만 생성
+            archive_dir = Path("archive/success") / run_id / jewelry_type
+            archive_dir.mkdir(parents=True, exist_ok=True)
+            
+            for file_path in paths:
+                dest_path = archive_dir / file_path.name
+                try:
+                    # 같은 파일 시스템이면 rename 한 번으로 이동
+                    os.rename(file_path, dest_path)
+                except FileNotFoundError:
+                    continue  # 이미 이동된 파일은 스킵
+                except OSError:
+                    try:
+                        shutil.move(str(file_path), str(dest_path))
+                    except Exception as e:
+                        # 이동 실패 시 로그만 남기고 계속 진행
+                        failed.append((file_path, e))
+                        continue
+                archived.append((file_path, archive_dir))
+        
+        # 로그는 이동이 끝난 뒤 한 번에 기록
+        for file_path, archive_dir in archived:
+            logger.info("✅ Archived: %s -> %s", file_path.name, archive_dir)
+        for file_path, e in failed:
+            logger.warning("Failed to archive %s: %s", file_path.name, e)
+        for file_path, status in kept:
+            if not file_path.exists():
+                continue
+            if status == "partial":
+                logger.info("🔶 Keeping in inbox for regeneration: %s", file_path.name)
+            else:
+                logger.info("⚠️  Keeping in inbox for retry: %s", file_path.name)
+
+
+class MetaWriterThread(QThread):
+    """Job 상태 변경을 meta.json에 저장하는 전용 스레드 (GUI 스레드는 디스크에 쓰지 않음)"""
+    dashboard_dirty = Signal(list)  # 저장된 job_id 목록
+    
+    def __init__(self, meta_queue: "queue.Queue"):
+        super().__init__()
+        self.meta_queue = meta_queue
+    
+    def run(self):
+        dirty = set()
+        last_emit = 0.0
+        stopping = False
+        while not stopping:
+            # 알릴 변경이 남아 있으면 다음 알림 시점까지만 대기
+            timeout = None
+            if dirty:
+                timeout = max(0.0, last_emit + META_DIRTY_INTERVAL - time.monotonic())
+            try:
+                item = self.meta_queue.get(timeout=timeout)
+            except queue.Empty:
+                item = ()
+            
+            # 대기열에 쌓인 변경을 모두 꺼내 Job당 마지막 상태만 저장
+            pending: Dict[str, str] = {}
+            while True:
+                if item is None:
+                    stopping = True
+                elif item:
+                    job_id, status = item
+                    pending[job_id] = status
                 try:
-                    # 파일 이동
-                    dest_path = archive_dir / file_path.name
-                    shutil.move(str(file_path), str(dest_path))
-                    print(f"✅ Archived: {file_path.name} -> {archive_dir}")
-                except Exception as e:
-                    # 이동 실패 시 로그만 남기고 계속 진행
-                    print(f"Failed to archive {file_path.name}: {e}")
+                    item = self.meta_queue.get_nowait()
+                except queue.Empty:
+                    break
             
-            elif status == "partial":
-                print(f"🔶 Keeping in inbox for regeneration: {file_path.name}")
-                # partial은 inbox에 그대로 유지
-                
-            else:  # failed
-                print(f"⚠️  Keeping in inbox for retry: {file_path.name}")
-                # failed도 inbox에 그대로 유지
+            dirty.update(self._write_status(pending))
+            
+            now = time.monotonic()
+            if dirty and not stopping and now - last_emit >= META_DIRTY_INTERVAL:
+                self.dashboard_dirty.emit(sorted(dirty))
+                dirty.clear()
+                last_emit = now
+    
+    def _write_status(self, pending: Dict[str, str]) -> List[str]:
+        """Job 상태를 meta.json에 저장하고 저장된 job_id 반환"""
+        written = []
+        now = datetime.now().isoformat()
+        for job_id, status in pending.items():
+            meta_path = Path("out") / job_id / "meta.json"
+            try:
+                # 재생성 스레드의 버전 기록과 겹치지 않도록 잠금 안에서 최신 내용을 읽고 저장
+                with META_WRITE_LOCK:
+                    raw = meta_path.read_bytes()
+                    if not raw.strip():
+                        logger.warning("Empty meta.json file for status update: %s", meta_path)
+                        continue
+                    meta = loads_json(raw)
+                    
+                    meta["status"] = status
+                    meta["updated_at"] = now
+                    write_json_atomic(meta_path, meta)
+                written.append(job_id)
+            except FileNotFoundError:
+                continue
+            except Exception:
+                logger.exception("Failed to update job status for %s", job_id)
+        return written
+
+
+class DashboardScanThread(QThread):
+    """대시보드 데이터 스캔 스레드 (inbox/out 폴더 스캔을 GUI 스레드 밖에서 수행)"""
+    scanned = Signal(object, object)  # pending_data, completed_data
+    
+    def __init__(self, scan_inbox, scan_completed):
+        super().__init__()
+        self.scan_inbox = scan_inbox
+        self.scan_completed = scan_completed
+    
+    def run(self):
+        try:
+            self.scanned.emit(self.scan_inbox(), self.scan_completed())
+        except Exception:
+            logger.exception("Dashboard scan failed")
 
 
 class JobDetailPanel(QWidget):
@@ -402,6 +713,11 @@ class JobDetailPanel(QWidget):
     def __init__(self):
         super().__init__()
         self.current_job = None
+        # job_id -> meta.json 내용의 CRC32: 내용이 바뀌지 않았으면 다시 로드하지 않음
+        self._load_cache: Dict[str, int] = {}
+        # 현재 Job의 산출물 경로 캐시
+        self._artifact_paths: Dict[str, ArtifactPaths] = {}
+        self._artifact_paths_job = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -509,26 +825,37 @@ class JobDetailPanel(QWidget):
         self.setLayout(main_layout)
     
     def load_job(self, job_id: str):
-        """Job 정보 로드 및 표시"""
-        self.current_job = job_id
+        """Job 정보 로드 및 표시 (meta.json 내용이 바뀌지 않았으면 건너뜀)"""
         job_dir = Path("out") / job_id
+        meta_path = job_dir / "meta.json"
+        desc_file = job_dir / "desc" / "desc.md"
         
-        if not job_dir.exists():
+        try:
+            raw = meta_path.read_bytes()
+        except OSError:
+            self.current_job = job_id
             return
+        # mtime은 파일 시스템에 따라 1~2초 단위라 빠른 재생성을 놓칠 수 있으므로 내용 체크섬 사용
+        # (산출물이 바뀌면 meta.json의 버전 정보도 함께 바뀜)
+        meta_crc = zlib.crc32(raw)
         
-        # meta.json 읽기
-        meta_path = job_dir / "meta.json"
-        if not meta_path.exists():
+        # 같은 Job이 이미 표시 중이고 내용이 바뀌지 않았으면 다시 그리지 않음
+        if self.current_job == job_id and self._load_cache.get(job_id) == meta_crc:
             return
         
+        # Job이 바뀐 경우에만 산출물 경로 재계산
+        if self._artifact_paths_job != job_id:
+            self._artifact_paths = {
+                a: ArtifactPaths(job_dir / a / f"{a}.png", job_dir / a)
+                for a in self.image_previews
+            }
+            self._artifact_paths_job = job_id
+        self.current_job = job_id
+        
         try:
-            with open(meta_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                if not content:
-                    print(f"Empty meta.json file: {meta_path}")
-                    return
-                meta = json.loads(content)
-        except json.JSONDecodeError as e:
+            # 표시에 필요한 최상위 필드만 읽기 (버전 이력 전체는 파싱하지 않음)
+            meta = peek_json_bytes(raw, ("status", "type", "created_at"))
+        except (json.JSONDecodeError, ValueError) as e:
             print(f"Invalid JSON in meta.json: {meta_path}, error: {e}")
             return
         except Exception as e:
@@ -542,76 +869,45 @@ class JobDetailPanel(QWidget):
         self.created_label.setText(meta.get("created_at", "-")[:19])
         
         # 상품 설명 미리보기
-        desc_file = job_dir / "desc" / "desc.md"
-        if desc_file.exists():
+        try:
             with open(desc_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                self.desc_preview.setPlainText(content[:500])
-        else:
+                self.desc_preview.setPlainText(f.read(500))
+        except FileNotFoundError:
             self.desc_preview.setPlainText("(생성되지 않음)")
         
-        # 주얼리 타입 확인
+        # 주얼리 타입 확인 후 표시할 산출물을 먼저 결정 (숨김 산출물은 파일 확인 생략)
         jewelry_type = meta.get("type", "").lower()
-        is_standard_jewelry = jewelry_type in ["ring", "necklace", "earring", "bracelet", "anklet"]
+        if jewelry_type in STANDARD_JEWELRY_TYPES:
+            # 표준 주얼리: styled, wear, closeup 표시
+            visible_labels = STANDARD_PREVIEW_LABELS
+        else:
+            # 기타 주얼리: styled, styled2, styled3을 연출컷 1, 2, 3으로 표시
+            visible_labels = EXTRA_PREVIEW_LABELS
+        
+        for artifact_type in self.image_previews.keys() - visible_labels.keys():
+            self.image_previews[artifact_type]["widget"].setVisible(False)
         
-        # 타입에 따라 라벨 동적 변경 및 표시 설정
-        for artifact_type, widgets in self.image_previews.items():
-            # 모든 위젯을 일단 표시
+        for artifact_type, label_text in visible_labels.items():
+            widgets = self.image_previews[artifact_type]
             widgets["widget"].setVisible(True)
             
             # 라벨 동적 변경
             label_widget = widgets["widget"].layout().itemAt(0).widget()  # QLabel
-            
-            if is_standard_jewelry:
-                # 표준 주얼리: styled, wear, closeup 표시
-                if artifact_type == "styled":
-                    label_widget.setText("연출컷")
-                elif artifact_type == "wear":
-                    label_widget.setText("착용컷")
-                elif artifact_type == "closeup":
-                    label_widget.setText("클로즈업")
-                elif artifact_type in ["styled2", "styled3"]:
-                    # 추가 연출컷 숨기기
-                    widgets["widget"].setVisible(False)
-                    continue
-            else:
-                # 기타 주얼리: styled, styled2, styled3을 연출컷 1, 2, 3으로 표시
-                if artifact_type == "styled":
-                    label_widget.setText("연출컷 1")
-                elif artifact_type == "styled2":
-                    label_widget.setText("연출컷 2")
-                elif artifact_type == "styled3":
-                    label_widget.setText("연출컷 3")
-                elif artifact_type in ["wear", "closeup"]:
-                    # 착용컷, 클로즈업 숨기기
-                    widgets["widget"].setVisible(False)
-                    continue
+            label_widget.setText(label_text)
             
             # 이미지 파일 확인 및 설정
+            paths = self._artifact_paths[artifact_type]
             if artifact_type.startswith("styled") and artifact_type != "styled":
-                # styled2, styled3의 경우 해당 폴더에서 이미지 찾기
-                artifact_dir = job_dir / artifact_type
-                if artifact_dir.exists():
-                    # 생성된 이미지 파일 찾기
-                    image_files = list(artifact_dir.glob("*_2x3_*.png")) + list(artifact_dir.glob("*_3x4_*.png"))
-                    if image_files:
-                        widgets["label"].set_image(str(image_files[0]))
-                        widgets["button"].setEnabled(True)
-                    else:
-                        widgets["label"].set_image("")
-                        widgets["button"].setEnabled(True)
-                else:
-                    widgets["label"].set_image("")
-                    widgets["button"].setEnabled(True)
+                # styled2, styled3의 경우 해당 폴더에서 생성된 이미지 찾기
+                image_files = find_output_images(paths.dir, OUTPUT_IMAGE_RE)
+                widgets["label"].set_image(str(image_files[0]) if image_files else "")
             else:
-                # 기본 산출물들 (styled, wear, closeup)
-                image_file = job_dir / artifact_type / f"{artifact_type}.png"
-                if image_file.exists():
-                    widgets["label"].set_image(str(image_file))
-                    widgets["button"].setEnabled(True)
-                else:
-                    widgets["label"].set_image("")
-                    widgets["button"].setEnabled(True)
+                # 기본 산출물들 (styled, wear, closeup) - 파일이 없으면 set_image가 빈 상태로 표시
+                widgets["label"].set_image(str(paths.preview))
+            widgets["button"].setEnabled(True)
+        
+        # 로드 성공 시 체크섬 기록
+        self._load_cache[job_id] = meta_crc
     
     def regenerate_artifact(self, artifact_type: str):
         """산출물 재생성 요청"""
@@ -630,7 +926,70 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.current_thread = None
         self.batch_thread = None
+        # 실행 중인 export 스레드 (완료 전 GC 방지)
+        self.export_threads = []
+        # 실행 중인 재생성 스레드와 대기열 (job_id, artifact_type)
+        self.regeneration_threads = set()
+        self.regeneration_queue = deque()
         self.refresh_timer = None
+        # 마지막으로 테이블에 표시한 데이터 (변경 없으면 다시 그리지 않음)
+        self._last_pending_data = None
+        self._last_completed_data = None
+        # meta.json 파싱 캐시: path -> ((mtime_ns, size), meta) - 바뀐 파일만 다시 읽음
+        self._meta_cache: Dict[Path, tuple] = {}
+        # inbox 폴더별 이미지 목록 캐시: folder -> (mtime_ns, files)
+        self._inbox_cache: Dict[Path, tuple] = {}
+        self._meta_executor = ThreadPoolExecutor(max_workers=META_SCAN_WORKERS, thread_name_prefix="meta-scan")
+        
+        # 배치 파일 완료 이벤트 묶음 처리 (200ms)
+        self._completed_buffer = []
+        self._completed_flush_timer = QTimer(self)
+        self._completed_flush_timer.setSingleShot(True)
+        self._completed_flush_timer.setInterval(200)
+        self._completed_flush_timer.timeout.connect(self._flush_completed_files)
+        
+        # 배치 진행 상태바 갱신 제한용 타이머
+        self._batch_status_timer = QElapsedTimer()
+        
+        # 종료 요청 후 실행 중인 스레드가 끝날 때까지 닫기 재시도
+        # (GenerationThread는 QThread.finished를 자체 신호로 가리므로 isRunning 폴링)
+        self._closing = False
+        self._close_retry_timer = QTimer(self)
+        self._close_retry_timer.setInterval(CLOSE_RETRY_INTERVAL_MS)
+        self._close_retry_timer.timeout.connect(self._retry_close)
+        
+        # Job 상태 변경 저장 전용 스레드 (대기열에 쌓인 변경은 Job당 1회 저장)
+        self._meta_queue: "queue.Queue" = queue.Queue()
+        self._meta_writer = MetaWriterThread(self._meta_queue)
+        self._meta_writer.dashboard_dirty.connect(self._on_job_status_written)
+        self._meta_writer.start()
+        
+        # Job 목록 새로고침 요청 묶음 처리 (200ms 안의 요청은 한 번의 load_jobs로)
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(JOB_RELOAD_COALESCE_MS)
+        self._reload_timer.timeout.connect(self._reload_views)
+        
+        # 상태 필터 적용 지연 타이머: (테이블 속성명, 상태)
+        self._pending_filter = None
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_pending_filter)
+        
+        # 대시보드 스캔 스레드 (재사용)
+        self._scan_thread = DashboardScanThread(self.scan_inbox_files, self.scan_completed_jobs)
+        self._scan_thread.scanned.connect(self._apply_dashboard_data)
+        self._scan_thread.finished.connect(self._on_scan_finished)
+        self._rescan_pending = False
+        
+        # 작업 폴더(out/, inbox/) 변경 감시 - 변경 시 주기를 기다리지 않고 바로 스캔
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.directoryChanged.connect(self._on_watched_dir_changed)
+        self._fs_change_timer = QTimer(self)
+        self._fs_change_timer.setSingleShot(True)
+        self._fs_change_timer.setInterval(FS_CHANGE_DEBOUNCE_MS)
+        self._fs_change_timer.timeout.connect(self.refresh_dashboard_data)
         
         # 첫 실행 확인 및 설정
         self.check_first_run()
@@ -638,10 +997,11 @@ class MainWindow(QMainWindow):
         self.setup_ui()
         self.refresh_dashboard_data()
         
-        # 자동 새로고침 타이머 (5초)
+        # 자동 새로고침 타이머 (5초, 폴더 감시 중에는 30초 보조 주기)
         self.refresh_timer = QTimer()
+        self.refresh_timer.setInterval(REFRESH_INTERVAL_MS)
         self.refresh_timer.timeout.connect(self.refresh_dashboard_data)
-        self.refresh_timer.start(5000)
+        self._update_polling()
     
     def setup_ui(self):
         self.setWindowTitle("주얼리 AI 생성 시스템")
@@ -754,8 +1114,15 @@ class MainWindow(QMainWindow):
         # 스플리터
         splitter = QSplitter(Qt.Horizontal)
         
-        # 좌측: 일반 모드와 대시보드 모드 전환 가능한 위젯
-        self.left_widget = QWidget()
+        # 좌측: 일반 모드와 대시보드 모드 전환 가능한 위젯 (두 페이지를 쌓아 두고 전환만 함)
+        self.left_widget = QStackedWidget()
+        self._normal_page = None
+        self._dashboard_page = None
+        self.job_table = None
+        self.status_filter = None
+        self.inbox_table = None
+        self.completed_table = None
+        self.completed_status_filter = None
         self.setup_dashboard_mode()  # 기본은 대시보드 모드
         splitter.addWidget(self.left_widget)
         
@@ -781,6 +1148,8 @@ class MainWindow(QMainWindow):
     def check_first_run(self):
         """첫 실행 확인 및 설정 가이드"""
         if config_manager.is_first_run():
+            # 설정 다이얼로그 모듈은 실제로 필요할 때만 로드
+            from src.ui.settings_dialog import FirstRunDialog
             dialog = FirstRunDialog(self)
             if dialog.exec() == QDialog.Accepted:
                 # 설정이 완료되면 작업 폴더를 업데이트
@@ -814,9 +1183,54 @@ class MainWindow(QMainWindow):
         
         model_settings = config_manager.get_model_settings()
         print(f"✅ 모델 설정: 텍스트={model_settings['model_text']}, 이미지={model_settings['model_image']}")
+        
+        # 새 작업 폴더 기준으로 감시 대상 갱신
+        self._watch_work_dirs()
+    
+    def _watch_work_dirs(self):
+        """out/, inbox/ 및 inbox 하위 폴더를 파일 시스템 감시 대상으로 등록"""
+        watched = self._fs_watcher.directories()
+        if watched:
+            self._fs_watcher.removePaths(watched)
+        
+        work_folder = config_manager.get_work_folder()
+        if not work_folder:
+            return
+        
+        paths = []
+        for name in ("out", "inbox"):
+            directory = work_folder / name
+            if directory.is_dir():
+                paths.append(str(directory))
+        inbox_dir = work_folder / "inbox"
+        if inbox_dir.is_dir():
+            # 타입별 하위 폴더에 파일이 추가되어도 inbox/ 자체의 수정 시각은 바뀌지 않음
+            paths.extend(entry.path for entry in iter_subdirs(inbox_dir))
+        if paths:
+            self._fs_watcher.addPaths(paths)
+        self._update_polling()
+    
+    def _update_polling(self):
+        """폴더 감시 중이면 주기적 새로고침을 보조 주기로 늘리고, 감시 대상이 없으면 기본 주기로 복원"""
+        if not self.refresh_timer or self._closing:
+            return
+        # 폴더 감시는 out/<job>/meta.json 변경(외부 gen run/regen 등)을 알리지 않으므로 폴링은 유지
+        interval = REFRESH_INTERVAL_WATCHED_MS if self._fs_watcher.directories() else REFRESH_INTERVAL_MS
+        if self.refresh_timer.interval() != interval:
+            self.refresh_timer.setInterval(interval)
+        if not self.refresh_timer.isActive():
+            self.refresh_timer.start()
+    
+    def _on_watched_dir_changed(self, path: str):
+        """감시 폴더 변경 알림 - 묶어서 한 번만 스캔"""
+        # inbox/에 하위 폴더가 생기거나 지워졌을 수 있으므로 감시 대상 재등록
+        if Path(path).name == "inbox":
+            self._watch_work_dirs()
+        self._fs_change_timer.start()
     
     def open_settings(self):
         """설정 다이얼로그 열기"""
+        from src.ui.settings_dialog import SettingsDialog
         dialog = SettingsDialog(self)
         if dialog.exec() == QDialog.Accepted:
             # 설정 변경 시 작업 디렉토리 업데이트
@@ -826,10 +1240,14 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "설정 완료", "설정이 저장되었습니다.")
     
     def setup_normal_mode(self):
-        """일반 모드 UI 설정 (기존 Job 테이블)"""
-        # 기존 위젯들 정리
-        self._clear_left_widget()
-        
+        """일반 모드로 전환 (기존 Job 테이블, 페이지는 처음 한 번만 생성)"""
+        if self._normal_page is None:
+            self._normal_page = self._build_normal_page()
+            self.left_widget.addWidget(self._normal_page)
+        self.left_widget.setCurrentWidget(self._normal_page)
+    
+    def _build_normal_page(self) -> QWidget:
+        """일반 모드 페이지 생성"""
         left_layout = QVBoxLayout()
         
         # 검색/필터
@@ -843,21 +1261,22 @@ class MainWindow(QMainWindow):
         left_layout.addLayout(filter_layout)
         
         # Job 테이블
-        self.job_table = QTableWidget()
-        self.job_table.setColumnCount(5)
-        self.job_table.setHorizontalHeaderLabels(["Job ID", "종류", "상태", "생성일", "파일명"])
-        self.job_table.horizontalHeader().setStretchLastSection(True)
-        self.job_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.job_table.itemSelectionChanged.connect(self.on_job_selected)
+        self.job_table = create_record_table(JOB_COLUMNS, self.on_job_selected)
         left_layout.addWidget(self.job_table)
         
-        self.left_widget.setLayout(left_layout)
+        page = QWidget()
+        page.setLayout(left_layout)
+        return page
     
     def setup_dashboard_mode(self):
-        """대시보드 모드 UI 설정 (inbox + 완료작업 분할)"""
-        # 기존 위젯들 정리
-        self._clear_left_widget()
-        
+        """대시보드 모드로 전환 (inbox + 완료작업 분할, 페이지는 처음 한 번만 생성)"""
+        if self._dashboard_page is None:
+            self._dashboard_page = self._build_dashboard_page()
+            self.left_widget.addWidget(self._dashboard_page)
+        self.left_widget.setCurrentWidget(self._dashboard_page)
+    
+    def _build_dashboard_page(self) -> QWidget:
+        """대시보드 모드 페이지 생성"""
         left_layout = QVBoxLayout()
         
         # 상단: inbox 대기 파일들
@@ -877,10 +1296,7 @@ class MainWindow(QMainWindow):
         inbox_layout.addLayout(inbox_info_layout)
         
         # inbox 파일 테이블
-        self.inbox_table = QTableWidget()
-        self.inbox_table.setColumnCount(3)
-        self.inbox_table.setHorizontalHeaderLabels(["종류", "파일명", "경로"])
-        self.inbox_table.horizontalHeader().setStretchLastSection(True)
+        self.inbox_table = create_record_table(INBOX_COLUMNS, id_key="path")
         self.inbox_table.setMaximumHeight(200)  # 상단 영역 크기 제한
         inbox_layout.addWidget(self.inbox_table)
         
@@ -909,104 +1325,57 @@ class MainWindow(QMainWindow):
         completed_layout.addLayout(filter_layout)
         
         # 완료 작업 테이블
-        self.completed_table = QTableWidget()
-        self.completed_table.setColumnCount(4)
-        self.completed_table.setHorizontalHeaderLabels(["Job ID", "종류", "상태", "생성일"])
-        self.completed_table.horizontalHeader().setStretchLastSection(True)
-        self.completed_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.completed_table.itemSelectionChanged.connect(self.on_completed_job_selected)
+        self.completed_table = create_record_table(COMPLETED_COLUMNS, self.on_completed_job_selected)
         completed_layout.addWidget(self.completed_table)
         
         completed_group.setLayout(completed_layout)
         left_layout.addWidget(completed_group)
         
-        self.left_widget.setLayout(left_layout)
+        page = QWidget()
+        page.setLayout(left_layout)
+        return page
     
     def _style_dialog_buttons(self, button_box):
         """다이얼로그 버튼에 스타일 적용"""
         # OK 버튼을 실행 버튼으로 변경
         ok_button = button_box.button(QDialogButtonBox.Ok)
         ok_button.setText("🚀 일괄 생성 시작")
-        ok_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4CAF50, stop:1 #45a049);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 20px;
-                font-weight: bold;
-                font-size: 12px;
-                min-width: 120px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5CBF60, stop:1 #4CAF50);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #45a049, stop:1 #3d8b40);
-            }
-        """)
+        ok_button.setStyleSheet(_OK_BUTTON_STYLE)
         
         # Cancel 버튼 스타일
         cancel_button = button_box.button(QDialogButtonBox.Cancel)
         cancel_button.setText("취소")
-        cancel_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f44336, stop:1 #da190b);
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 20px;
-                font-weight: bold;
-                font-size: 12px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #f66356, stop:1 #f44336);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #da190b, stop:1 #c62828);
-            }
-        """)
+        cancel_button.setStyleSheet(_CANCEL_BUTTON_STYLE)
     
-    def _clear_left_widget(self):
-        """왼쪽 위젯의 기존 내용을 안전하게 정리"""
-        # 기존 위젯들 참조 제거
-        if hasattr(self, 'job_table'):
-            self.job_table = None
-        if hasattr(self, 'status_filter'):
-            self.status_filter = None
-        if hasattr(self, 'inbox_table'):
-            self.inbox_table = None
-        if hasattr(self, 'completed_table'):
-            self.completed_table = None
-        if hasattr(self, 'completed_status_filter'):
-            self.completed_status_filter = None
-        
-        # 기존 레이아웃 제거
-        if self.left_widget.layout():
-            layout = self.left_widget.layout()
-            while layout.count():
-                child = layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
-            QWidget().setLayout(layout)
+    def refresh_dashboard_data(self):
+        """대시보드 데이터 새로고침 (스캔은 백그라운드 스레드에서 수행)"""
+        # 이전 스캔이 아직 진행 중이면 끝난 뒤 한 번 더 스캔 (스레드는 하나만 재사용)
+        if self._scan_thread.isRunning():
+            self._rescan_pending = True
+            return
+        self._scan_thread.start()
     
+    def _on_scan_finished(self):
+        """스캔 중에 들어온 새로고침 요청이 있으면 다시 스캔"""
+        if self._rescan_pending:
+            self._rescan_pending = False
+            self.refresh_dashboard_data()
     
-    def refresh_dashboard_data(self):
-        """대시보드 데이터 새로고침"""
-        # inbox 파일 스캔
-        pending_data = self.scan_inbox_files()
-        self.update_inbox_table(pending_data)
+    def _apply_dashboard_data(self, pending_data, completed_data):
+        """스캔 결과를 대시보드 테이블에 반영 (내용이 바뀐 테이블만 다시 그림)"""
+        # 모드 전환 등으로 테이블이 없으면 무시
+        if getattr(self, 'inbox_table', None) is None or getattr(self, 'completed_table', None) is None:
+            return
         
-        # 완료 작업 스캔
-        completed_data = self.scan_completed_jobs()
-        self.update_completed_jobs_table(completed_data)
+        # inbox 파일
+        if pending_data != self._last_pending_data:
+            self.update_inbox_table(pending_data)
+            self._last_pending_data = pending_data
+        
+        # 완료 작업
+        if completed_data != self._last_completed_data:
+            self.update_completed_jobs_table(completed_data)
+            self._last_completed_data = completed_data
     
     def scan_inbox_files(self):
         """inbox 폴더에서 대기 중인 파일들 스캔"""
@@ -1018,28 +1387,56 @@ class MainWindow(QMainWindow):
         if not inbox_dir.exists():
             return {}
         
-        from src.batch_processor import get_image_files
-        
         pending_files = {}
         
         # 모든 하위 폴더 확인 (타입 제한 없음)
-        for folder in inbox_dir.iterdir():
-            if not folder.is_dir():
-                continue
-            
+        for folder in iter_subdirs(inbox_dir):
             folder_name = folder.name.lower()
-            image_files = get_image_files(folder)
+            image_files = self._cached_image_files(Path(folder.path))
             if image_files:
                 pending_files[folder_name] = image_files
         
         # 폴더 구조가 없으면 루트 레벨 파일 확인
         if not pending_files:
-            root_files = get_image_files(inbox_dir)
+            root_files = self._cached_image_files(inbox_dir)
             if root_files:
                 pending_files["기타"] = root_files
         
         return pending_files
     
+    def _cached_image_files(self, folder: Path) -> List[Path]:
+        """폴더 이미지 목록 (폴더 수정 시각이 같으면 이전 스캔 결과 재사용)"""
+        # 파일 추가/삭제/이름 변경은 폴더 수정 시각을 바꾸므로 목록 캐시 키로 충분
+        mtime = folder.stat().st_mtime_ns
+        cached = self._inbox_cache.get(folder)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        image_files = get_image_files(folder)
+        self._inbox_cache[folder] = (mtime, image_files)
+        return image_files
+    
+    def _load_meta(self, meta_path: Path) -> Optional[dict]:
+        """meta.json 요약 필드 로드 (수정 시각/크기가 같으면 캐시 사용, 빈 파일은 None)"""
+        st = meta_path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._meta_cache.get(meta_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        raw = meta_path.read_bytes()
+        # 목록에는 최상위 요약 필드만 필요하므로 버전 이력(artifacts)은 파싱하지 않음
+        meta = None if not raw or raw.isspace() else peek_json_bytes(raw, META_SUMMARY_KEYS)
+        self._meta_cache[meta_path] = (stamp, meta)
+        return meta
+    
+    def _try_load_meta(self, meta_path: Path):
+        """스레드 풀용 meta.json 로드 - (meta, 예외) 반환"""
+        try:
+            return self._load_meta(meta_path), None
+        except Exception as e:
+            return None, e
+    
     def scan_completed_jobs(self):
         """완료된 작업들 스캔 (out/ 폴더의 모든 처리된 작업)"""
         work_folder = config_manager.get_work_folder()
@@ -1047,62 +1444,51 @@ class MainWindow(QMainWindow):
             return []
         
         out_dir = work_folder / "out"
-        if not out_dir.exists():
+        if not out_dir.is_dir():
             return []
         
+        # meta.json 읽기는 스레드 풀에서 병렬로 수행 (바뀌지 않은 파일은 캐시에서 stat 1회)
+        job_ids = []
+        meta_paths = []
+        for job_dir in iter_subdirs(out_dir):
+            job_ids.append(job_dir.name)
+            meta_paths.append(Path(job_dir.path) / "meta.json")
+        results = self._meta_executor.map(self._try_load_meta, meta_paths)
+        
         jobs = []
-        for job_dir in out_dir.iterdir():
-            if not job_dir.is_dir():
-                continue
-            
-            meta_path = job_dir / "meta.json"
-            if not meta_path.exists():
-                continue
-            
-            try:
-                with open(meta_path, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    if not content:
-                        # 빈 파일인 경우
-                        jobs.append({
-                            "job_id": job_dir.name,
-                            "type": "알 수 없음",
-                            "status": "오류",
-                            "created_at": "-",
-                            "src_name": "빈 meta.json"
-                        })
-                        continue
-                    meta = json.loads(content)
-                
+        for job_id, (meta, error) in zip(job_ids, results):
+            if error is None and meta is not None:
                 # 모든 상태의 작업 포함 (done, partial, failed, processing)
                 jobs.append({
-                    "job_id": job_dir.name,
+                    "job_id": job_id,
                     "type": meta.get("type", "-"),
                     "status": meta.get("status", "-"),
                     "created_at": meta.get("created_at", "-"),
+                    # 표시용 생성일은 스캔 시 한 번만 자름
+                    "created_at_short": meta.get("created_at", "-")[:19],
                     "src_name": meta.get("src_name", "-")
                 })
-            except json.JSONDecodeError as e:
-                # JSON 파싱 실패한 경우
-                jobs.append({
-                    "job_id": job_dir.name,
-                    "type": "알 수 없음",
-                    "status": "오류",
-                    "created_at": "-",
-                    "src_name": f"JSON 오류: {str(e)[:20]}..."
-                })
-            except Exception as e:
-                # 기타 파싱 실패한 경우
-                jobs.append({
-                    "job_id": job_dir.name,
-                    "type": "알 수 없음",
-                    "status": "오류",
-                    "created_at": "-",
-                    "src_name": f"파일 오류: {str(e)[:20]}..."
-                })
+                continue
+            
+            if isinstance(error, FileNotFoundError):
+                continue  # meta.json이 없는 폴더는 작업이 아님
+            if error is None:
+                src_name = "빈 meta.json"
+            elif isinstance(error, json.JSONDecodeError):
+                src_name = f"JSON 오류: {str(error)[:20]}..."
+            else:
+                src_name = f"파일 오류: {str(error)[:20]}..."
+            jobs.append({
+                "job_id": job_id,
+                "type": "알 수 없음",
+                "status": "오류",
+                "created_at": "-",
+                "created_at_short": "-",
+                "src_name": src_name
+            })
         
         # 생성일 기준 정렬 (최신순)
-        jobs.sort(key=lambda x: x["created_at"], reverse=True)
+        jobs.sort(key=itemgetter("created_at"), reverse=True)
         return jobs
     
     def update_inbox_table(self, pending_data):
@@ -1110,66 +1496,64 @@ class MainWindow(QMainWindow):
         total_pending = sum(len(files) for files in pending_data.values())
         self.inbox_count_label.setText(f"대기 중인 파일: {total_pending}개")
         
-        self.inbox_table.setRowCount(0)
-        
-        for jewelry_type, files in pending_data.items():
-            for file_path in files:
-                row = self.inbox_table.rowCount()
-                self.inbox_table.insertRow(row)
-                
-                self.inbox_table.setItem(row, 0, QTableWidgetItem(jewelry_type))
-                self.inbox_table.setItem(row, 1, QTableWidgetItem(file_path.name))
-                self.inbox_table.setItem(row, 2, QTableWidgetItem(str(file_path)))
+        record_model(self.inbox_table).set_rows([
+            {"type": jewelry_type, "name": file_path.name, "path": str(file_path)}
+            for jewelry_type, files in pending_data.items()
+            for file_path in files
+        ])
     
     def update_completed_jobs_table(self, completed_data):
         """완료 작업 테이블 업데이트"""
         self.completed_count_label.setText(f"완료된 작업: {len(completed_data)}개")
         
-        self.completed_table.setRowCount(0)
-        
-        for job in completed_data:
-            row = self.completed_table.rowCount()
-            self.completed_table.insertRow(row)
-            
-            self.completed_table.setItem(row, 0, QTableWidgetItem(job["job_id"]))
-            self.completed_table.setItem(row, 1, QTableWidgetItem(job["type"]))
-            self.completed_table.setItem(row, 2, QTableWidgetItem(job["status"]))
-            self.completed_table.setItem(row, 3, QTableWidgetItem(job["created_at"][:19]))
-            
-            # 상태에 따른 색상
-            status_item = self.completed_table.item(row, 2)
-            if job["status"] == "done":
-                status_item.setBackground(Qt.green)
-            elif job["status"] == "partial":
-                status_item.setBackground(Qt.yellow)
-            elif job["status"] == "failed":
-                status_item.setBackground(Qt.red)
-            elif job["status"] == "reprocessing":
-                status_item.setBackground(Qt.cyan)  # 재처리 중은 하늘색
+        # 상태 필터는 프록시 모델에 유지되므로 데이터만 교체
+        record_model(self.completed_table).set_rows(completed_data)
     
     def filter_completed_jobs(self, status: str):
         """완료 작업 상태별 필터링"""
-        if not hasattr(self, 'completed_table'):
+        if getattr(self, 'completed_table', None) is None:
             return
         
-        for row in range(self.completed_table.rowCount()):
-            if status == "전체":
-                self.completed_table.setRowHidden(row, False)
-            else:
-                job_status = self.completed_table.item(row, 2).text()
-                self.completed_table.setRowHidden(row, job_status != status)
+        self._pending_filter = ("completed_table", status)
+        self._filter_timer.start()
+    
+    def _apply_pending_filter(self):
+        """마지막으로 선택된 상태 필터만 적용"""
+        if self._pending_filter is None:
+            return
+        table_attr, status = self._pending_filter
+        self._pending_filter = None
+        
+        table = getattr(self, table_attr, None)
+        if table is None:
+            return
+        try:
+            apply_status_filter(table, status)
+        except RuntimeError:
+            # 모드 전환으로 위젯이 이미 삭제된 경우 무시
+            pass
     
     def on_completed_job_selected(self):
         """완료 작업 선택 시 상세 정보 표시"""
-        if not hasattr(self, 'completed_table'):
+        if getattr(self, 'completed_table', None) is None:
             return
         
-        current_row = self.completed_table.currentRow()
-        if current_row < 0:
+        job = selected_record(self.completed_table)
+        if job is None:
             return
         
-        job_id = self.completed_table.item(current_row, 0).text()
-        self.detail_panel.load_job(job_id)
+        self.detail_panel.load_job(job["job_id"])
+    
+    def _schedule_load_jobs(self):
+        """Job 목록 새로고침 예약 (연속 요청은 한 번으로 합침)"""
+        if not self._reload_timer.isActive():
+            self._reload_timer.start()
+    
+    def _reload_views(self):
+        """예약된 새로고침 실행 - 일반 모드는 Job 목록, 대시보드 모드는 대시보드 스캔"""
+        self.load_jobs()
+        if getattr(self, 'completed_table', None) is not None:
+            self.refresh_dashboard_data()
     
     def load_jobs(self):
         """Job 목록 로드 (일반 모드용)"""
@@ -1183,76 +1567,56 @@ class MainWindow(QMainWindow):
         # 현재 선택된 job 저장
         current_selection = None
         try:
-            if self.job_table.currentRow() >= 0:
-                current_selection = self.job_table.item(self.job_table.currentRow(), 0).text()
+            job = selected_record(self.job_table)
+            if job is not None:
+                current_selection = job["job_id"]
         except (RuntimeError, AttributeError):
             # 위젯이 이미 삭제된 경우 무시
-            pass
-        
-        try:
-            self.job_table.setRowCount(0)
-        except (RuntimeError, AttributeError):
             return
+        
         jobs = []
         
         # 모든 job 디렉토리 확인
-        for job_dir in out_dir.iterdir():
-            if not job_dir.is_dir():
-                continue
-            
-            meta_path = job_dir / "meta.json"
-            if not meta_path.exists():
-                continue
+        for job_dir in iter_subdirs(out_dir):
+            meta_path = Path(job_dir.path) / "meta.json"
             
             try:
-                with open(meta_path, 'r', encoding='utf-8') as f:
-                    content = f.read().strip()
-                    if not content:
-                        continue  # 빈 파일은 건너뛰기
-                    meta = json.loads(content)
+                meta = self._load_meta(meta_path)
+                if meta is None:
+                    continue  # 빈 파일은 건너뛰기
                 
                 jobs.append({
                     "job_id": job_dir.name,
                     "type": meta.get("type", "-"),
                     "status": meta.get("status", "-"),
                     "created_at": meta.get("created_at", "-"),
+                    # 표시용 생성일은 스캔 시 한 번만 자름
+                    "created_at_short": meta.get("created_at", "-")[:19],
                     "src_name": meta.get("src_name", "-")
                 })
             except (json.JSONDecodeError, Exception):
                 continue  # 파싱 실패한 파일은 건너뛰기
         
         # 생성일 기준 정렬 (최신순)
-        jobs.sort(key=lambda x: x["created_at"], reverse=True)
+        jobs.sort(key=itemgetter("created_at"), reverse=True)
         
-        # 테이블에 추가
+        # 테이블에 반영 (모델 데이터만 교체)
         try:
-            for job in jobs:
-                row = self.job_table.rowCount()
-                self.job_table.insertRow(row)
-                
-                self.job_table.setItem(row, 0, QTableWidgetItem(job["job_id"]))
-                self.job_table.setItem(row, 1, QTableWidgetItem(job["type"]))
-                self.job_table.setItem(row, 2, QTableWidgetItem(job["status"]))
-                self.job_table.setItem(row, 3, QTableWidgetItem(job["created_at"][:19]))
-                self.job_table.setItem(row, 4, QTableWidgetItem(job["src_name"]))
+            self.job_table.setUpdatesEnabled(False)
+            try:
+                model = record_model(self.job_table)
+                model.set_rows(jobs)
                 
-                # 상태에 따른 색상
-                status_item = self.job_table.item(row, 2)
-                if job["status"] == "done":
-                    status_item.setBackground(Qt.green)
-                elif job["status"] == "partial":
-                    status_item.setBackground(Qt.yellow)
-                elif job["status"] == "failed":
-                    status_item.setBackground(Qt.red)
-                elif job["status"] == "reprocessing":
-                    status_item.setBackground(Qt.cyan)  # 재처리 중은 하늘색
-            
-            # 이전 선택 복원
-            if current_selection:
-                for row in range(self.job_table.rowCount()):
-                    if self.job_table.item(row, 0).text() == current_selection:
-                        self.job_table.selectRow(row)
-                        break
+                # 이전 선택 복원 (필터로 숨겨진 행은 제외)
+                if current_selection:
+                    for row, job in enumerate(jobs):
+                        if job["job_id"] == current_selection:
+                            view_index = self.job_table.model().mapFromSource(model.index(row, 0))
+                            if view_index.isValid():
+                                self.job_table.selectRow(view_index.row())
+                            break
+            finally:
+                self.job_table.setUpdatesEnabled(True)
         except (RuntimeError, AttributeError):
             return
         
@@ -1263,15 +1627,8 @@ class MainWindow(QMainWindow):
         if not hasattr(self, 'job_table') or self.job_table is None:
             return
         
-        try:
-            for row in range(self.job_table.rowCount()):
-                if status == "전체":
-                    self.job_table.setRowHidden(row, False)
-                else:
-                    job_status = self.job_table.item(row, 2).text()
-                    self.job_table.setRowHidden(row, job_status != status)
-        except (RuntimeError, AttributeError):
-            pass
+        self._pending_filter = ("job_table", status)
+        self._filter_timer.start()
     
     def on_job_selected(self):
         """Job 선택 시 상세 정보 표시 (일반 모드용)"""
@@ -1279,12 +1636,11 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            current_row = self.job_table.currentRow()
-            if current_row < 0:
+            job = selected_record(self.job_table)
+            if job is None:
                 return
             
-            job_id = self.job_table.item(current_row, 0).text()
-            self.detail_panel.load_job(job_id)
+            self.detail_panel.load_job(job["job_id"])
         except (RuntimeError, AttributeError):
             pass
     
@@ -1301,6 +1657,11 @@ class MainWindow(QMainWindow):
             self.open_settings()
             return
         
+        # 이전 배치가 끝나기 전에는 새 배치를 시작하지 않음 (강제 종료 없이)
+        if self.batch_thread and self.batch_thread.isRunning():
+            QMessageBox.information(self, "배치 처리 중", "진행 중인 배치 처리가 끝난 뒤 다시 시도해주세요.")
+            return
+        
         # inbox 폴더 기본 경로
         default_inbox = work_folder / "inbox"
         
@@ -1308,7 +1669,8 @@ class MainWindow(QMainWindow):
         inbox_dir = QFileDialog.getExistingDirectory(
             self, 
             "입력 폴더 선택", 
-            str(default_inbox)
+            str(default_inbox),
+            _DIR_DIALOG_OPTIONS
         )
         if not inbox_dir:
             return
@@ -1384,11 +1746,6 @@ class MainWindow(QMainWindow):
             self.progress_bar.setValue(0)
             self.progress_bar.setVisible(True)
             
-            # 이전 배치 스레드 정리
-            if self.batch_thread and self.batch_thread.isRunning():
-                self.batch_thread.terminate()
-                self.batch_thread.wait()
-            
             # 배치 스레드 시작 (폴더 기반)
             self.batch_thread = BatchGenerationThread(
                 inbox_dir=inbox_path,
@@ -1480,11 +1837,6 @@ class MainWindow(QMainWindow):
                 auto_archive=auto_archive
             )
         
-        # 이전 배치 스레드 정리
-        if self.batch_thread and self.batch_thread.isRunning():
-            self.batch_thread.terminate()
-            self.batch_thread.wait()
-        
         # 신호 연결 (타입 정보 포함)
         self.batch_thread.progress.connect(self.on_batch_progress)
         self.batch_thread.file_completed.connect(self.on_file_completed)
@@ -1508,18 +1860,7 @@ class MainWindow(QMainWindow):
     
     def start_regeneration_thread(self, job_id: str, artifact_type: str):
         """재생성 스레드 시작 (제한된 병렬처리 + 대기열)"""
-        # 재생성 관리 초기화
-        if not hasattr(self, 'regeneration_threads'):
-            self.regeneration_threads = []
-        if not hasattr(self, 'regeneration_queue'):
-            self.regeneration_queue = []
-        
-        # 완료된 스레드 정리
-        self.regeneration_threads = [t for t in self.regeneration_threads if t.isRunning()]
-        
-        # 설정에서 최대 동시 실행 개수 가져오기
-        config = config_manager.load_config()
-        max_regeneration_workers = min(config.get("max_workers", 2), 4)  # 최대 4개로 제한
+        max_regeneration_workers = self._max_regeneration_workers()
         
         # 현재 실행 중인 재생성 개수 확인
         running_count = len(self.regeneration_threads)
@@ -1535,6 +1876,11 @@ class MainWindow(QMainWindow):
             self._update_regeneration_status()
             print(f"⏳ 재생성 대기열 추가: {job_id}/{artifact_type} (대기: {len(self.regeneration_queue)}개)")
     
+    def _max_regeneration_workers(self) -> int:
+        """설정에서 최대 동시 재생성 개수 가져오기 (최대 4개로 제한)"""
+        config = config_manager.load_config()
+        return min(config.get("max_workers", 2), 4)
+    
     def _start_regeneration_now(self, job_id: str, artifact_type: str):
         """재생성 즉시 시작"""
         regen_thread = GenerationThread(
@@ -1547,7 +1893,7 @@ class MainWindow(QMainWindow):
         regen_thread.finished.connect(lambda result: self._on_regeneration_completed(result, job_id, regen_thread))
         regen_thread.error.connect(lambda error: self._on_regeneration_error(error, job_id, regen_thread))
         
-        self.regeneration_threads.append(regen_thread)
+        self.regeneration_threads.add(regen_thread)
         regen_thread.start()
     
     def _on_regeneration_completed(self, result, job_id: str, thread):
@@ -1555,11 +1901,8 @@ class MainWindow(QMainWindow):
         # 기존 완료 처리
         self.on_regeneration_finished(result, job_id)
         
-        # 스레드 제거
-        if thread in self.regeneration_threads:
-            self.regeneration_threads.remove(thread)
-        
-        # 대기열에서 다음 작업 실행
+        # 스레드 제거 후 빈 자리에 대기열 작업 실행
+        self.regeneration_threads.discard(thread)
         self._process_regeneration_queue()
         
         # 상태 업데이트
@@ -1570,20 +1913,18 @@ class MainWindow(QMainWindow):
         # 기존 오류 처리
         self.on_regeneration_error(error, job_id)
         
-        # 스레드 제거
-        if thread in self.regeneration_threads:
-            self.regeneration_threads.remove(thread)
-        
-        # 대기열에서 다음 작업 실행
+        # 스레드 제거 후 빈 자리에 대기열 작업 실행
+        self.regeneration_threads.discard(thread)
         self._process_regeneration_queue()
         
         # 상태 업데이트
         self._update_regeneration_status()
     
     def _process_regeneration_queue(self):
-        """대기열에서 다음 재생성 작업 실행"""
-        if hasattr(self, 'regeneration_queue') and self.regeneration_queue:
-            job_id, artifact_type = self.regeneration_queue.pop(0)
+        """대기열에서 다음 재생성 작업 실행 (동시 실행 한도까지)"""
+        max_regeneration_workers = self._max_regeneration_workers()
+        while self.regeneration_queue and len(self.regeneration_threads) < max_regeneration_workers:
+            job_id, artifact_type = self.regeneration_queue.popleft()
             self._start_regeneration_now(job_id, artifact_type)
             
             remaining = len(self.regeneration_queue)
@@ -1591,14 +1932,6 @@ class MainWindow(QMainWindow):
     
     def _update_regeneration_status(self):
         """재생성 상태바 업데이트"""
-        if not hasattr(self, 'regeneration_threads'):
-            self.regeneration_threads = []
-        if not hasattr(self, 'regeneration_queue'):
-            self.regeneration_queue = []
-        
-        # 완료된 스레드 정리
-        self.regeneration_threads = [t for t in self.regeneration_threads if t.isRunning()]
-        
         running_count = len(self.regeneration_threads)
         queue_count = len(self.regeneration_queue)
         
@@ -1613,62 +1946,46 @@ class MainWindow(QMainWindow):
             self.statusBar().showMessage(f"재생성 중... ({running_count}개 실행중, {queue_count}개 대기중)")
     
     def _update_job_status(self, job_id: str, status: str):
-        """Job 상태 업데이트"""
-        try:
-            job_dir = Path("out") / job_id
-            meta_path = job_dir / "meta.json"
-            
-            if meta_path.exists():
-                try:
-                    with open(meta_path, 'r', encoding='utf-8') as f:
-                        content = f.read().strip()
-                        if not content:
-                            print(f"Empty meta.json file for status update: {meta_path}")
-                            return
-                        meta = json.loads(content)
-                    
-                    meta["status"] = status
-                    meta["updated_at"] = datetime.now().isoformat()
-                    
-                    with open(meta_path, 'w', encoding='utf-8') as f:
-                        json.dump(meta, f, indent=2, ensure_ascii=False)
-                except (json.JSONDecodeError, Exception) as e:
-                    print(f"Failed to update job status for {job_id}: {e}")
-                    return
-                
-                # 대시보드 새로고침
-                self.refresh_dashboard_data()
-        except Exception as e:
-            print(f"Failed to update job status: {e}")
+        """Job 상태 업데이트 (저장은 전용 스레드에서 Job당 1회씩)"""
+        self._meta_queue.put((job_id, status))
+    
+    def _on_job_status_written(self, job_ids: list):
+        """상태 저장 완료 시 대시보드 새로고침 (최대 초당 1회)"""
+        self.refresh_dashboard_data()
+        if self.detail_panel.current_job in job_ids:
+            self.detail_panel.load_job(self.detail_panel.current_job)
     
     def export_job(self, job_id: str):
         """Job export"""
         # 대상 폴더 선택
-        export_dir = QFileDialog.getExistingDirectory(self, "Export 대상 폴더", "export")
+        export_dir = QFileDialog.getExistingDirectory(self, "Export 대상 폴더", "export", _DIR_DIALOG_OPTIONS)
         if not export_dir:
             return
         
-        try:
-            # CLI export 함수 사용
-            import subprocess
-            result = subprocess.run([
-                sys.executable, "gen.py", "export",
-                "--job", job_id,
-                "--to", export_dir
-            ], capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                QMessageBox.information(self, "성공", f"Export 완료: {export_dir}")
-            else:
-                QMessageBox.warning(self, "실패", f"Export 실패: {result.stderr}")
-        except Exception as e:
-            QMessageBox.critical(self, "오류", str(e))
+        # 내부 export 함수를 백그라운드 스레드에서 직접 호출 (CLI 프로세스 없이)
+        export_thread = GenerationThread("export", job_id=job_id, export_dir=export_dir)
+        export_thread.finished.connect(lambda result: self._on_export_finished(result, export_thread))
+        export_thread.error.connect(lambda error: self._on_export_error(error, export_thread))
+        self.export_threads.append(export_thread)
+        export_thread.start()
+        self.statusBar().showMessage(f"Export 중... ({job_id})")
+    
+    def _on_export_finished(self, result: dict, thread):
+        """Export 완료"""
+        if thread in self.export_threads:
+            self.export_threads.remove(thread)
+        self.statusBar().showMessage("Export 완료")
+        QMessageBox.information(self, "성공", f"Export 완료: {result['export_dir']}")
+    
+    def _on_export_error(self, error: str, thread):
+        """Export 실패"""
+        if thread in self.export_threads:
+            self.export_threads.remove(thread)
+        self.statusBar().showMessage("Export 실패")
+        QMessageBox.warning(self, "실패", f"Export 실패: {error}")
     
     def open_inbox_folder(self):
         """inbox 폴더 열기"""
-        import subprocess
-        import platform
-        
         work_folder = config_manager.get_work_folder()
         if not work_folder:
             QMessageBox.warning(
@@ -1688,36 +2005,22 @@ class MainWindow(QMainWindow):
             )
             return
         
-        try:
-            if platform.system() == "Windows":
-                subprocess.Popen(["explorer", str(inbox_dir)])
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.Popen(["open", str(inbox_dir)])
-            else:  # Linux
-                subprocess.Popen(["xdg-open", str(inbox_dir)])
-        except Exception as e:
-            QMessageBox.warning(self, "오류", f"폴더 열기 실패: {str(e)}")
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(inbox_dir))):
+            QMessageBox.warning(self, "오류", f"폴더 열기 실패: {inbox_dir}")
     
     def open_output_folder(self):
         """출력 폴더 열기"""
-        import subprocess
-        import platform
-        
         out_dir = Path("out").absolute()
-        if platform.system() == "Windows":
-            subprocess.Popen(["explorer", str(out_dir)])
-        elif platform.system() == "Darwin":  # macOS
-            subprocess.Popen(["open", str(out_dir)])
-        else:  # Linux
-            subprocess.Popen(["xdg-open", str(out_dir)])
+        QDesktopServices.openUrl(QUrl.fromLocalFile(str(out_dir)))
     
     def on_generation_finished(self, result: dict):
         """생성 완료"""
         if result.get("success") or result.get("status"):
             self.statusBar().showMessage("생성 완료!")
-            self.load_jobs()
         else:
             QMessageBox.warning(self, "경고", "일부 생성 실패")
+        # 실패/부분 성공도 meta.json 상태가 바뀌었으므로 목록 갱신
+        self._schedule_load_jobs()
     
     def on_regeneration_finished(self, result: dict, job_id: str):
         """재생성 완료"""
@@ -1725,47 +2028,68 @@ class MainWindow(QMainWindow):
             # 재생성 성공 시 상태를 done으로 복원
             self._update_job_status(job_id, "done")
             self.statusBar().showMessage("재생성 완료!")
-            self.load_jobs()
+            self._schedule_load_jobs()
             # 현재 선택된 job 다시 로드
             self.detail_panel.load_job(job_id)
         else:
             # 재생성 실패 시 상태를 failed로 변경
             self._update_job_status(job_id, "failed")
+            self._schedule_load_jobs()
             QMessageBox.warning(self, "실패", f"재생성 실패: {result.get('error')}")
     
     def on_regeneration_error(self, error: str, job_id: str):
         """재생성 오류"""
         # 오류 발생 시 상태를 failed로 변경
         self._update_job_status(job_id, "failed")
+        self._schedule_load_jobs()
         QMessageBox.critical(self, "오류", f"재생성 중 오류 발생: {error}")
         self.statusBar().showMessage("재생성 오류 발생")
     
     def on_batch_progress(self, current: int, total: int, current_file: str, jewelry_type: str = ""):
         """배치 진행률 업데이트 (타입 정보 포함)"""
-        self.progress_bar.setValue(current)
+        # 상태바 repaint는 최대 10Hz로 제한 (마지막 파일은 항상 표시)
+        if (current < total and self._batch_status_timer.isValid()
+                and self._batch_status_timer.elapsed() < BATCH_STATUS_THROTTLE_MS):
+            return
+        self._batch_status_timer.restart()
+        
+        if self.progress_bar.value() != current:
+            self.progress_bar.setValue(current)
         if jewelry_type:
-            self.statusBar().showMessage(f"처리 중... ({current}/{total}) - {current_file} ({jewelry_type})")
+            message = _BATCH_PROGRESS_TYPED(current, total, current_file, jewelry_type)
         else:
-            self.statusBar().showMessage(f"처리 중... ({current}/{total}) - {current_file}")
+            message = _BATCH_PROGRESS_PLAIN(current, total, current_file)
+        self.statusBar().showMessage(message)
     
     def on_file_completed(self, file_name: str, result: dict, jewelry_type: str = ""):
-        """개별 파일 처리 완료 (타입 정보 포함)"""
-        if result.get("success", False) or result.get("status") == "done":
-            if jewelry_type:
-                logger.info(f"✅ Completed: {file_name} ({jewelry_type})")
-            else:
-                logger.info(f"✅ Completed: {file_name}")
-        else:
-            if jewelry_type:
-                logger.warning(f"⚠️  Failed: {file_name} ({jewelry_type}) - {result.get('error', 'Unknown error')}")
+        """개별 파일 처리 완료 (타입 정보 포함) - 짧은 간격의 완료 이벤트는 모아서 처리"""
+        self._completed_buffer.append((file_name, result, jewelry_type))
+        if not self._completed_flush_timer.isActive():
+            self._completed_flush_timer.start()
+    
+    def _flush_completed_files(self):
+        """모아둔 파일 완료 이벤트를 한 번에 처리"""
+        completed, self._completed_buffer = self._completed_buffer, []
+        if not completed:
+            return
+        
+        for file_name, result, jewelry_type in completed:
+            # 로그 레벨이 꺼져 있으면 문자열을 만들지 않도록 지연 포맷 사용
+            type_suffix = f" ({jewelry_type})" if jewelry_type else ""
+            if result.get("success", False) or result.get("status") == "done":
+                logger.info("✅ Completed: %s%s", file_name, type_suffix)
             else:
-                logger.warning(f"⚠️  Failed: {file_name} - {result.get('error', 'Unknown error')}")
+                logger.warning("⚠️  Failed: %s%s - %s", file_name, type_suffix, result.get('error', 'Unknown error'))
         
-        # Job 목록 새로고침 (새로운 Job이 추가되었을 수 있음)
-        self.load_jobs()
+        # Job 목록 새로고침 (새로운 Job이 추가되었을 수 있음) - 묶음당 한 번만
+        self._schedule_load_jobs()
     
     def on_batch_finished(self, stats: dict):
         """배치 처리 완료"""
+        # 남아있는 파일 완료 이벤트 먼저 처리
+        self._completed_flush_timer.stop()
+        self._flush_completed_files()
+        
         self.progress_bar.setVisible(False)
         
         total = stats.get("total", 0)
@@ -1793,43 +2117,74 @@ class MainWindow(QMainWindow):
         else:
             QMessageBox.warning(self, "배치 처리 완료", result_text)
         
-        # Job 목록 최종 새로고침
-        self.load_jobs()
+        # Job 목록 최종 새로고침 (직전 파일 완료 요청과 합쳐짐)
+        self._schedule_load_jobs()
     
     def on_generation_error(self, error: str):
         """생성 오류"""
         self.progress_bar.setVisible(False)
+        self._schedule_load_jobs()
         QMessageBox.critical(self, "오류", f"생성 중 오류 발생: {error}")
         self.statusBar().showMessage("오류 발생")
     
     def closeEvent(self, event):
         """애플리케이션 종료 시 스레드 정리"""
-        # 실행 중인 스레드들 정리
-        if hasattr(self, 'current_thread') and self.current_thread and self.current_thread.isRunning():
-            self.current_thread.terminate()
-            self.current_thread.wait(3000)  # 3초 대기
-        
-        if hasattr(self, 'batch_thread') and self.batch_thread and self.batch_thread.isRunning():
-            self.batch_thread.terminate()
-            self.batch_thread.wait(3000)  # 3초 대기
-        
-        # 재생성 스레드들 정리
-        if hasattr(self, 'regeneration_threads'):
-            for thread in self.regeneration_threads:
-                if thread.isRunning():
-                    thread.terminate()
-                    thread.wait(1000)  # 1초 대기
-        
-        # 재생성 대기열 정리
-        if hasattr(self, 'regeneration_queue'):
+        if not self._closing:
+            self._closing = True
+            # 대기 중인 재생성은 시작하지 않음
             self.regeneration_queue.clear()
+            
+            # 타이머와 폴더 감시 정리 (대기 중인 단발 타이머가 종료 중에 새 스캔을 시작하지 않도록)
+            if hasattr(self, 'refresh_timer') and self.refresh_timer:
+                self.refresh_timer.stop()
+            for timer in (self._fs_change_timer, self._reload_timer, self._completed_flush_timer):
+                timer.stop()
+            watched = self._fs_watcher.directories()
+            if watched:
+                self._fs_watcher.removePaths(watched)
+            
+            # 실행 중인 스레드들에 중단 요청 (강제 종료 없이 협조적으로 종료)
+            for thread in self._shutdown_threads():
+                thread.requestInterruption()
+                # 종료 중에는 완료/오류 다이얼로그나 새로고침 등 후속 작업을 띄우지 않음
+                thread.blockSignals(True)
+            if self.batch_thread:
+                self.batch_thread.cancel()
+            # 상태 저장 스레드는 대기열의 변경을 모두 기록한 뒤 종료
+            self._meta_queue.put(None)
+        
+        # 스레드 개수와 관계없이 전체 3초 안에서 병렬로 종료 대기
+        deadline = QDeadlineTimer(3000)
+        for thread in self._shutdown_threads():
+            thread.wait(deadline)
+        
+        running = [thread for thread in self._shutdown_threads() if thread.isRunning()]
+        if running:
+            # 진행 중인 API 호출이 끝날 때까지 창을 닫지 않고 주기적으로 다시 시도
+            event.ignore()
+            self.setEnabled(False)
+            self.statusBar().showMessage(f"종료 중... 진행 중인 작업 {len(running)}개가 끝나기를 기다리는 중")
+            self._close_retry_timer.start()
+            return
         
-        # 타이머 정리
-        if hasattr(self, 'refresh_timer') and self.refresh_timer:
-            self.refresh_timer.stop()
+        self._close_retry_timer.stop()
+        self._meta_executor.shutdown(wait=False)
         
         event.accept()
-
+    
+    def _shutdown_threads(self) -> list:
+        """종료 시 끝날 때까지 기다려야 하는 스레드 목록"""
+        threads = [*self.regeneration_threads, *self.export_threads, self._scan_thread, self._meta_writer]
+        if self.current_thread:
+            threads.append(self.current_thread)
+        if self.batch_thread:
+            threads.append(self.batch_thread)
+        return threads
+    
+    def _retry_close(self):
+        """남은 스레드가 모두 끝났으면 창 닫기 재시도"""
+        if not any(thread.isRunning() for thread in self._shutdown_threads()):
+            self.close()
 
 def main():
     app = QApplication(sys.argv)
@@ -3,8 +3,12 @@
 작업 폴더 선택 및 기타 설정
 """
 import os
+import sys
+import threading
 from pathlib import Path
-from PySide6.QtCore import Qt
+from typing import Optional
+from PySide6.QtCore import Qt, QUrl, QObject, QRunnable, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QDesktopServices
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLabel, QPushButton, QLineEdit, QFileDialog, 
@@ -17,16 +21,140 @@ from PySide6.QtWidgets import (
 from ..config_manager import config_manager
 
 
+# API 키 테스트 요청 타임아웃 (초, 응답 없는 엔드포인트에 작업 스레드가 묶이지 않도록)
+API_TEST_TIMEOUT = 5.0
+# API 키 입력 후 상태 라벨 갱신까지 대기 (ms, 연속 입력/붙여넣기는 마지막에 한 번만 갱신)
+API_STATUS_DEBOUNCE_MS = 100
+
+# API 키 상태 라벨: 상태별 문구와 색상 (스타일시트는 한 번만 설정하고 apiState 속성으로 전환)
+_API_STATUS_TEXT = {
+    "empty": "API 키가 설정되지 않았습니다",
+    "bad": "잘못된 API 키 형식",
+    "ok": "API 키가 설정되었습니다",
+}
+_API_STATUS_STYLE = """
+QLabel[apiState="empty"] { color: orange; }
+QLabel[apiState="bad"] { color: red; }
+QLabel[apiState="ok"] { color: green; }
+"""
+
+# 폴더 선택 다이얼로그 옵션 (네이티브 다이얼로그, 폴더만 표시, 폴더별 아이콘 조회 생략)
+_DIR_DIALOG_OPTIONS = QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontUseCustomDirectoryIcons
+
+# 첫 실행 다이얼로그 스타일
+_WELCOME_LABEL_STYLE = "font-size: 18px; font-weight: bold; margin: 20px;"
+_OK_BUTTON_STYLE = """
+QPushButton {
+    background-color: #4CAF50;
+    color: white;
+    border: none;
+    padding: 8px 16px;
+    border-radius: 4px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #45a049;
+}
+QPushButton:disabled {
+    background-color: #cccccc;
+}
+"""
+
+
+# API 테스트용 OpenAI 클라이언트 (api_key, client) - 키가 같으면 연결 풀/TLS 설정 재사용
+_openai_client = None
+_openai_client_lock = threading.Lock()
+
+
+def _get_openai_client(api_key: str):
+    """API 테스트용 OpenAI 클라이언트 반환 (키가 바뀌면 새로 생성)"""
+    global _openai_client
+    with _openai_client_lock:
+        if _openai_client is None or _openai_client[0] != api_key:
+            import openai
+            
+            if _openai_client is not None:
+                _openai_client[1].close()
+            # 키를 직접 전달 (환경변수는 건드리지 않음)
+            client = openai.OpenAI(api_key=api_key, timeout=API_TEST_TIMEOUT, max_retries=0)
+            _openai_client = (api_key, client)
+        return _openai_client[1]
+
+
+def _prewarm_openai():
+    """openai 모듈 미리 import (httpx/pydantic 초기화 비용을 첫 테스트 클릭에서 숨김)"""
+    try:
+        import openai  # noqa: F401
+    except ImportError:
+        # 미설치 시 테스트 클릭에서 오류 표시
+        pass
+
+
+def _form_group(title: str, rows) -> QGroupBox:
+    """(라벨, 위젯/레이아웃) 목록으로 QFormLayout 그룹 박스 생성"""
+    group = QGroupBox(title)
+    form = QFormLayout(group)
+    for label, field in rows:
+        form.addRow(label, field)
+    return group
+
+
+def _line_edit(placeholder: str) -> QLineEdit:
+    """안내 문구가 있는 입력란 생성"""
+    line = QLineEdit()
+    line.setPlaceholderText(placeholder)
+    return line
+
+
+class _ApiTestSignals(QObject):
+    """API 테스트 결과 신호 (QRunnable은 QObject가 아니므로 별도 객체 사용)"""
+    finished = Signal(bool, str)  # success, error message
+
+
+class ApiTestRunnable(QRunnable):
+    """API 키 테스트 작업 (GUI 스레드를 막지 않도록 스레드 풀에서 실행)"""
+    
+    def __init__(self, api_key: str):
+        super().__init__()
+        self.api_key = api_key
+        self.signals = _ApiTestSignals()
+    
+    def run(self):
+        try:
+            # 모델 목록 요청 (가장 간단한 테스트)
+            _get_openai_client(self.api_key).models.list()
+            
+            self.signals.finished.emit(True, "")
+            
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
+
+
 class SettingsDialog(QDialog):
     """설정 다이얼로그"""
     
+    # 프롬프트 타입 (콤보 박스/추가 프롬프트 테이블 행 순서)
+    _PROMPT_TYPES = ("desc", "styled", "wear", "wear_closeup", "thumb")
+    _PROMPT_TYPE_BY_INDEX = dict(enumerate(_PROMPT_TYPES))
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("설정")
         self.setModal(True)
         self.resize(600, 500)
+        # 다이얼로그가 열려 있는 동안 설정/프롬프트 파일은 한 번만 읽고 메모리에서 사용
+        # (프롬프트는 프롬프트 탭을 처음 열 때 로드)
+        self._config = config_manager.load_config()
+        self._prompts_cache = None
+        self._prompt_tab_built = False
+        # 존재가 확인된 작업 폴더 (경로 입력란은 읽기 전용이라 폴더 선택 시에만 바뀜)
+        self._work_folder_validated: Optional[Path] = None
         self.setup_ui()
         self.load_settings()
+        
+        # 아직 import되지 않았으면 백그라운드에서 openai 모듈 로드
+        if "openai" not in sys.modules:
+            QThreadPool.globalInstance().start(_prewarm_openai)
     
     def setup_ui(self):
         layout = QVBoxLayout()
@@ -73,9 +201,6 @@ class SettingsDialog(QDialog):
         general_layout.addWidget(work_folder_group)
         
         # API 키 설정
-        api_group = QGroupBox("API 키 설정")
-        api_layout = QFormLayout()
-        
         # OpenAI API 키
         api_key_layout = QHBoxLayout()
         self.api_key_line = QLineEdit()
@@ -83,6 +208,13 @@ class SettingsDialog(QDialog):
         self.api_key_line.setPlaceholderText("sk-...")
         api_key_layout.addWidget(self.api_key_line)
         
+        # 입력 중 상태 라벨 실시간 갱신 (입력이 멈춘 뒤 한 번만)
+        self._api_status_timer = QTimer(self)
+        self._api_status_timer.setSingleShot(True)
+        self._api_status_timer.setInterval(API_STATUS_DEBOUNCE_MS)
+        self._api_status_timer.timeout.connect(self.update_api_status)
+        self.api_key_line.textChanged.connect(self._api_status_timer.start)
+        
         # 표시/숨기기 버튼
         self.show_api_btn = QPushButton("표시")
         self.show_api_btn.setMaximumWidth(60)
@@ -95,62 +227,50 @@ class SettingsDialog(QDialog):
         self.test_api_btn.clicked.connect(self.test_api_key)
         api_key_layout.addWidget(self.test_api_btn)
         
-        api_layout.addRow("OpenAI API 키:", api_key_layout)
-        
         # API 키 상태
-        self.api_status_label = QLabel("API 키가 설정되지 않았습니다")
-        self.api_status_label.setStyleSheet("color: orange;")
-        api_layout.addRow("상태:", self.api_status_label)
-        
-        api_group.setLayout(api_layout)
-        general_layout.addWidget(api_group)
-        
-        # 모델 설정
-        model_group = QGroupBox("모델 설정")
-        model_layout = QFormLayout()
-        
-        # 텍스트 생성 모델
-        self.model_text_line = QLineEdit()
-        self.model_text_line.setPlaceholderText("gpt-4o")
-        model_layout.addRow("텍스트 모델:", self.model_text_line)
-        
-        # 이미지 생성 모델
-        self.model_image_line = QLineEdit()
-        self.model_image_line.setPlaceholderText("gpt-image-1")
-        model_layout.addRow("이미지 모델:", self.model_image_line)
-        
-        # 출력 폴더
-        self.default_out_line = QLineEdit()
-        self.default_out_line.setPlaceholderText("out")
-        model_layout.addRow("출력 폴더:", self.default_out_line)
-        
-        model_group.setLayout(model_layout)
-        general_layout.addWidget(model_group)
+        self.api_status_label = QLabel(_API_STATUS_TEXT["empty"])
+        self.api_status_label.setStyleSheet(_API_STATUS_STYLE)
+        self.api_status_label.setProperty("apiState", "empty")
+        # 마지막으로 표시한 상태 (같은 상태면 스타일시트 재적용 생략)
+        self._last_api_state = "empty"
+        
+        general_layout.addWidget(_form_group("API 키 설정", (
+            ("OpenAI API 키:", api_key_layout),
+            ("상태:", self.api_status_label),
+        )))
+        
+        # 모델 설정 (텍스트 생성 모델, 이미지 생성 모델, 출력 폴더)
+        self.model_text_line = _line_edit("gpt-4o")
+        self.model_image_line = _line_edit("gpt-image-1")
+        self.default_out_line = _line_edit("out")
+        general_layout.addWidget(_form_group("모델 설정", (
+            ("텍스트 모델:", self.model_text_line),
+            ("이미지 모델:", self.model_image_line),
+            ("출력 폴더:", self.default_out_line),
+        )))
         
         # 처리 설정
-        processing_group = QGroupBox("처리 설정")
-        processing_layout = QFormLayout()
-        
         # 동시 처리 수
         self.max_workers_spin = QSpinBox()
         self.max_workers_spin.setRange(1, 8)
         self.max_workers_spin.setValue(2)
-        processing_layout.addRow("동시 처리 파일 수:", self.max_workers_spin)
         
         # 자동 정리
         self.auto_archive_check = QCheckBox("성공한 파일을 자동으로 archive로 이동")
         self.auto_archive_check.setChecked(True)
-        processing_layout.addRow("자동 정리:", self.auto_archive_check)
         
-        processing_group.setLayout(processing_layout)
-        general_layout.addWidget(processing_group)
+        general_layout.addWidget(_form_group("처리 설정", (
+            ("동시 처리 파일 수:", self.max_workers_spin),
+            ("자동 정리:", self.auto_archive_check),
+        )))
         
         general_tab.setLayout(general_layout)
         tab_widget.addTab(general_tab, "일반 설정")
         
-        # 프롬프트 설정 탭
-        prompt_tab = self.create_prompt_tab()
-        tab_widget.addTab(prompt_tab, "프롬프트 설정")
+        # 프롬프트 설정 탭 (처음 선택될 때 생성)
+        tab_widget.addTab(QWidget(), "프롬프트 설정")
+        tab_widget.currentChanged.connect(self._on_tab_changed)
+        self._tab_widget = tab_widget
         
         layout.addWidget(tab_widget)
         
@@ -178,12 +298,14 @@ class SettingsDialog(QDialog):
     
     def load_settings(self):
         """현재 설정 로드"""
-        config = config_manager.load_config()
+        config = self._config
         
         # 작업 폴더
         work_folder = config.get("work_folder", "")
         self.work_folder_line.setText(work_folder)
-        self.open_folder_btn.setEnabled(bool(work_folder and Path(work_folder).exists()))
+        if work_folder and Path(work_folder).is_dir():
+            self._work_folder_validated = Path(work_folder)
+        self.open_folder_btn.setEnabled(self._work_folder_validated is not None)
         
         # API 키
         api_key = config_manager.get_openai_api_key()
@@ -209,22 +331,32 @@ class SettingsDialog(QDialog):
         folder = QFileDialog.getExistingDirectory(
             self, 
             "작업 폴더 선택",
-            current_folder
+            current_folder,
+            _DIR_DIALOG_OPTIONS
         )
         
         if folder:
             self.work_folder_line.setText(folder)
+            # getExistingDirectory는 존재하는 폴더만 반환하므로 다시 확인하지 않음
+            self._work_folder_validated = Path(folder)
             self.open_folder_btn.setEnabled(True)
             
             # 필요한 하위 폴더들 생성
             try:
                 created_folders = config_manager.create_work_folders(Path(folder))
-                if created_folders:
-                    QMessageBox.information(
-                        self,
-                        "폴더 생성 완료",
-                        f"다음 폴더들이 생성되었습니다:\n" + "\n".join(f"• {folder}" for folder in created_folders)
-                    )
+                # 이미 모두 있으면 (두 번째 선택부터 대부분) 안내 없이 종료
+                if not created_folders:
+                    return
+                
+                # 이벤트 루프를 막지 않도록 exec() 대신 open()으로 표시
+                message_box = QMessageBox(
+                    QMessageBox.Information,
+                    "폴더 생성 완료",
+                    "다음 폴더들이 생성되었습니다:\n" + "\n".join("• " + name for name in created_folders),
+                    parent=self
+                )
+                message_box.setAttribute(Qt.WA_DeleteOnClose)
+                message_box.open()
             except Exception as e:
                 QMessageBox.warning(
                     self,
@@ -234,21 +366,10 @@ class SettingsDialog(QDialog):
     
     def open_work_folder(self):
         """작업 폴더 열기"""
-        work_folder = self.work_folder_line.text()
-        if work_folder and Path(work_folder).exists():
-            import subprocess
-            import platform
-            
-            try:
-                system = platform.system()
-                if system == "Darwin":  # macOS
-                    subprocess.run(["open", work_folder])
-                elif system == "Windows":
-                    subprocess.run(["explorer", work_folder])
-                else:  # Linux
-                    subprocess.run(["xdg-open", work_folder])
-            except Exception as e:
-                QMessageBox.warning(self, "오류", f"폴더 열기 실패: {str(e)}")
+        work_folder = self._work_folder_validated
+        if work_folder is not None:
+            if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(work_folder))):
+                QMessageBox.warning(self, "오류", f"폴더 열기 실패: {work_folder}")
     
     def accept(self):
         """설정 저장"""
@@ -262,20 +383,20 @@ class SettingsDialog(QDialog):
             QMessageBox.warning(self, "경고", "선택한 폴더가 존재하지 않습니다.")
             return
         
-        # API 키 저장
+        # 모든 설정을 한 번에 반영하고 파일은 1회만 저장
+        config = config_manager.load_config()
+        
+        # API 키
         api_key = self.api_key_line.text().strip()
         if api_key:
-            config_manager.set_openai_api_key(api_key)
+            config["openai_api_key"] = api_key
         
-        # 모델 설정 저장
-        config_manager.set_model_settings(
-            self.model_text_line.text().strip() or "gpt-4o",
-            self.model_image_line.text().strip() or "gpt-image-1",
-            self.default_out_line.text().strip() or "out"
-        )
+        # 모델 설정
+        config["model_text"] = self.model_text_line.text().strip() or "gpt-4o"
+        config["model_image"] = self.model_image_line.text().strip() or "gpt-image-1"
+        config["default_out_root"] = self.default_out_line.text().strip() or "out"
         
-        # 설정 저장
-        config = config_manager.load_config()
+        # 처리 설정
         config["work_folder"] = work_folder
         config["max_workers"] = self.max_workers_spin.value()
         config["auto_archive"] = self.auto_archive_check.isChecked()
@@ -283,6 +404,10 @@ class SettingsDialog(QDialog):
         
         config_manager.save_config(config)
         
+        # 환경변수에도 설정 (현재 세션용)
+        if api_key:
+            os.environ["OPENAI_API_KEY"] = api_key
+        
         super().accept()
     
     def toggle_api_key_visibility(self):
@@ -306,41 +431,27 @@ class SettingsDialog(QDialog):
             QMessageBox.warning(self, "경고", "올바른 OpenAI API 키 형식이 아닙니다.\n(sk-로 시작해야 합니다)")
             return
         
-        # 간단한 API 테스트
-        try:
-            import openai
-            import os
-            
-            # 임시로 API 키 설정
-            old_key = os.environ.get("OPENAI_API_KEY")
-            os.environ["OPENAI_API_KEY"] = api_key
-            
-            # OpenAI 클라이언트 생성 및 간단한 요청
-            client = openai.OpenAI(api_key=api_key)
-            
-            # 모델 목록 요청 (가장 간단한 테스트)
-            models = client.models.list()
-            
-            # 원래 키 복원
-            if old_key:
-                os.environ["OPENAI_API_KEY"] = old_key
-            else:
-                os.environ.pop("OPENAI_API_KEY", None)
-            
+        # 네트워크 요청은 스레드 풀에서 실행 (완료될 때까지 버튼 비활성화)
+        self.test_api_btn.setEnabled(False)
+        self.test_api_btn.setText("...")
+        self._api_test = ApiTestRunnable(api_key)
+        self._api_test.signals.finished.connect(self._on_api_test_finished)
+        QThreadPool.globalInstance().start(self._api_test)
+    
+    def _on_api_test_finished(self, success: bool, error: str):
+        """API 키 테스트 결과 표시"""
+        self._api_test = None
+        self.test_api_btn.setEnabled(True)
+        self.test_api_btn.setText("테스트")
+        
+        if success:
             QMessageBox.information(self, "테스트 성공", "✅ API 키가 정상적으로 작동합니다!")
             self.update_api_status()
-            
-        except Exception as e:
-            # 원래 키 복원
-            if old_key:
-                os.environ["OPENAI_API_KEY"] = old_key
-            else:
-                os.environ.pop("OPENAI_API_KEY", None)
-            
+        else:
             QMessageBox.warning(
                 self, 
                 "테스트 실패", 
-                f"❌ API 키 테스트에 실패했습니다:\n{str(e)}"
+                f"❌ API 키 테스트에 실패했습니다:\n{error}"
             )
     
     def update_api_status(self):
@@ -348,14 +459,42 @@ class SettingsDialog(QDialog):
         api_key = self.api_key_line.text().strip()
         
         if not api_key:
-            self.api_status_label.setText("API 키가 설정되지 않았습니다")
-            self.api_status_label.setStyleSheet("color: orange;")
+            state = "empty"
         elif not api_key.startswith("sk-"):
-            self.api_status_label.setText("잘못된 API 키 형식")
-            self.api_status_label.setStyleSheet("color: red;")
+            state = "bad"
         else:
-            self.api_status_label.setText("API 키가 설정되었습니다")
-            self.api_status_label.setStyleSheet("color: green;")
+            state = "ok"
+        
+        # 상태가 바뀌었을 때만 라벨 갱신 (스타일 재적용 비용 회피)
+        if state == self._last_api_state:
+            return
+        self._last_api_state = state
+        
+        # 스타일시트는 다시 파싱하지 않고 속성만 바꿔 색상 전환
+        label = self.api_status_label
+        label.setText(_API_STATUS_TEXT[state])
+        label.setProperty("apiState", state)
+        label.style().unpolish(label)
+        label.style().polish(label)
+    
+    def _on_tab_changed(self, index: int):
+        """프롬프트 탭을 처음 열 때 실제 내용으로 교체"""
+        if index != 1 or self._prompt_tab_built:
+            return
+        self._prompt_tab_built = True
+        self._prompts_cache = config_manager.load_prompts_config()
+        
+        # 탭 교체 중 currentChanged 재진입 방지
+        tab_widget = self._tab_widget
+        tab_widget.blockSignals(True)
+        try:
+            placeholder = tab_widget.widget(1)
+            tab_widget.removeTab(1)
+            placeholder.deleteLater()
+            tab_widget.insertTab(1, self.create_prompt_tab(), "프롬프트 설정")
+            tab_widget.setCurrentIndex(1)
+        finally:
+            tab_widget.blockSignals(False)
     
     def create_prompt_tab(self):
         """프롬프트 설정 탭 생성"""
@@ -405,14 +544,10 @@ class SettingsDialog(QDialog):
         jewelry_type_layout = QHBoxLayout()
         jewelry_type_layout.addWidget(QLabel("주얼리 타입:"))
         self.jewelry_type_combo = QComboBox()
-        self.jewelry_type_combo.addItems([
-            "ring",
-            "necklace",
-            "earring",
-            "bracelet",
-            "anklet",
-            "other"
-        ])
+        jewelry_types = ["ring", "necklace", "earring", "bracelet", "anklet", "other"]
+        self.jewelry_type_combo.addItems(jewelry_types)
+        # 중복 확인용 (콤보 박스 항목과 함께 갱신)
+        self._jewelry_type_set = set(jewelry_types)
         self.jewelry_type_combo.currentIndexChanged.connect(self.load_jewelry_prompts)
         jewelry_type_layout.addWidget(self.jewelry_type_combo)
         
@@ -432,9 +567,7 @@ class SettingsDialog(QDialog):
         # 추가 프롬프트 테이블
         self.jewelry_prompts_table = QTableWidget(5, 2)
         self.jewelry_prompts_table.setHorizontalHeaderLabels(["프롬프트 타입", "추가 내용"])
-        self.jewelry_prompts_table.setVerticalHeaderLabels([
-            "desc", "styled", "wear", "wear_closeup", "thumb"
-        ])
+        self.jewelry_prompts_table.setVerticalHeaderLabels(list(self._PROMPT_TYPES))
         
         # 테이블 크기 및 표시 설정 개선
         self.jewelry_prompts_table.horizontalHeader().setStretchLastSection(True)
@@ -449,8 +582,23 @@ class SettingsDialog(QDialog):
         # 텍스트 줄바꿈 허용
         self.jewelry_prompts_table.setWordWrap(True)
         
-        # 행 크기를 내용에 맞게 자동 조정
-        self.jewelry_prompts_table.resizeRowsToContents()
+        # 셀 항목은 한 번만 만들고 타입 변경 시에는 텍스트만 교체
+        self._jewelry_prompt_items = []
+        for i, prompt_type in enumerate(self._PROMPT_TYPES):
+            # 타입명 표시 (읽기 전용)
+            type_item = QTableWidgetItem(prompt_type)
+            type_item.setFlags(type_item.flags() & ~Qt.ItemIsEditable)
+            self.jewelry_prompts_table.setItem(i, 0, type_item)
+            
+            # 추가 프롬프트 (텍스트 줄바꿈 지원 및 세로 정렬)
+            content_item = QTableWidgetItem("")
+            content_item.setTextAlignment(Qt.AlignTop | Qt.AlignLeft)
+            self.jewelry_prompts_table.setItem(i, 1, content_item)
+            self._jewelry_prompt_items.append((prompt_type, content_item))
+        
+        # 사용자가 수정한 행만 저장하도록 변경 추적 (로드 중에는 신호 차단)
+        self._dirty_jewelry_rows = set()
+        self.jewelry_prompts_table.itemChanged.connect(self._on_jewelry_prompt_changed)
         
         jewelry_layout.addWidget(self.jewelry_prompts_table)
         
@@ -475,18 +623,11 @@ class SettingsDialog(QDialog):
     
     def get_prompt_type_key(self):
         """현재 선택된 프롬프트 타입의 키 반환"""
-        type_map = {
-            0: "desc",
-            1: "styled",
-            2: "wear",
-            3: "wear_closeup",
-            4: "thumb"
-        }
-        return type_map.get(self.prompt_type_combo.currentIndex(), "desc")
+        return self._PROMPT_TYPE_BY_INDEX.get(self.prompt_type_combo.currentIndex(), "desc")
     
     def load_prompt(self):
         """선택된 프롬프트 로드"""
-        prompts_config = config_manager.load_prompts_config()
+        prompts_config = self._prompts_cache
         prompt_type = self.get_prompt_type_key()
         
         base_prompts = prompts_config.get("base_prompts", {})
@@ -499,7 +640,9 @@ class SettingsDialog(QDialog):
         prompt_type = self.get_prompt_type_key()
         content = self.prompt_edit.toPlainText()
         
-        config_manager.update_base_prompt(prompt_type, content)
+        # 메모리 캐시를 직접 갱신한 뒤 저장 (파일 다시 읽지 않음)
+        self._prompts_cache.setdefault("base_prompts", {})[prompt_type] = content
+        config_manager.save_prompts_config(self._prompts_cache)
         
         QMessageBox.information(
             self,
@@ -509,43 +652,55 @@ class SettingsDialog(QDialog):
     
     def load_jewelry_prompts(self):
         """선택된 주얼리 타입의 추가 프롬프트 로드"""
-        prompts_config = config_manager.load_prompts_config()
+        prompts_config = self._prompts_cache
         jewelry_type = self.jewelry_type_combo.currentText()
         
         jewelry_specific = prompts_config.get("jewelry_specific", {})
         type_prompts = jewelry_specific.get(jewelry_type, {})
         
-        # 테이블 초기화
-        prompt_types = ["desc", "styled", "wear", "wear_closeup", "thumb"]
-        for i, prompt_type in enumerate(prompt_types):
-            # 타입명 표시 (읽기 전용)
-            type_item = QTableWidgetItem(prompt_type)
-            type_item.setFlags(type_item.flags() & ~Qt.ItemIsEditable)
-            self.jewelry_prompts_table.setItem(i, 0, type_item)
-            
-            # 추가 프롬프트
-            content = type_prompts.get(prompt_type, "")
-            content_item = QTableWidgetItem(content)
-            # 텍스트 줄바꿈 지원 및 세로 정렬
-            content_item.setTextAlignment(Qt.AlignTop | Qt.AlignLeft)
-            self.jewelry_prompts_table.setItem(i, 1, content_item)
+        # 다른 타입으로 바뀌면 저장하지 않은 수정 내역은 버림
+        self._dirty_jewelry_rows.clear()
         
-        # 내용에 맞게 행 높이 자동 조정
-        self.jewelry_prompts_table.resizeRowsToContents()
+        # 내용이 다른 셀만 텍스트 교체 (신호/다시 그리기는 끝나고 한 번만)
+        table = self.jewelry_prompts_table
+        changed = False
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            for prompt_type, content_item in self._jewelry_prompt_items:
+                content = type_prompts.get(prompt_type, "")
+                if content_item.text() != content:
+                    content_item.setText(content)
+                    changed = True
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+        
+        # 내용이 바뀐 경우에만 행 높이 자동 조정 (빈 타입끼리 전환 시 글꼴 측정 생략)
+        if changed:
+            table.resizeRowsToContents()
+    
+    def _on_jewelry_prompt_changed(self, item):
+        """추가 프롬프트 셀 수정 기록"""
+        if item.column() == 1:
+            self._dirty_jewelry_rows.add(item.row())
     
     def save_jewelry_prompts(self):
-        """주얼리별 추가 프롬프트 저장"""
+        """주얼리별 추가 프롬프트 저장 (수정된 행만 한 번에 저장)"""
         jewelry_type = self.jewelry_type_combo.currentText()
-        prompt_types = ["desc", "styled", "wear", "wear_closeup", "thumb"]
-        
-        for i, prompt_type in enumerate(prompt_types):
-            item = self.jewelry_prompts_table.item(i, 1)
-            if item and item.text().strip():
-                config_manager.update_jewelry_specific_prompt(
-                    jewelry_type,
-                    prompt_type,
-                    item.text().strip()
-                )
+        
+        changes = {}
+        for row in sorted(self._dirty_jewelry_rows):
+            prompt_type, item = self._jewelry_prompt_items[row]
+            if item.text().strip():
+                changes[prompt_type] = item.text().strip()
+        
+        if changes:
+            config_manager.update_jewelry_specific_prompts_bulk(jewelry_type, changes)
+            # 다시 로드할 때 파일을 읽지 않도록 메모리 캐시도 갱신
+            jewelry_specific = self._prompts_cache.setdefault("jewelry_specific", {})
+            jewelry_specific.setdefault(jewelry_type, {}).update(changes)
+        self._dirty_jewelry_rows.clear()
         
         QMessageBox.information(
             self,
@@ -561,16 +716,16 @@ class SettingsDialog(QDialog):
             return
         
         # 이미 있는지 확인
-        for i in range(self.jewelry_type_combo.count()):
-            if self.jewelry_type_combo.itemText(i) == new_type:
-                QMessageBox.warning(
-                    self,
-                    "경고",
-                    f"'{new_type}'은(는) 이미 존재합니다."
-                )
-                return
+        if new_type in self._jewelry_type_set:
+            QMessageBox.warning(
+                self,
+                "경고",
+                f"'{new_type}'은(는) 이미 존재합니다."
+            )
+            return
         
         # 추가
+        self._jewelry_type_set.add(new_type)
         self.jewelry_type_combo.addItem(new_type)
         self.jewelry_type_combo.setCurrentText(new_type)
         self.new_type_line.clear()
@@ -579,7 +734,8 @@ class SettingsDialog(QDialog):
         work_folder = config_manager.get_work_folder()
         if work_folder:
             new_folder = work_folder / "inbox" / new_type
-            new_folder.mkdir(exist_ok=True)
+            # inbox/가 아직 없어도 함께 생성
+            new_folder.mkdir(parents=True, exist_ok=True)
             
             QMessageBox.information(
                 self,
@@ -604,7 +760,7 @@ class FirstRunDialog(QDialog):
         
         # 환영 메시지
         welcome_label = QLabel("🎉 JewelryAI에 오신 것을 환영합니다!")
-        welcome_label.setStyleSheet("font-size: 18px; font-weight: bold; margin: 20px;")
+        welcome_label.setStyleSheet(_WELCOME_LABEL_STYLE)
         welcome_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(welcome_label)
         
@@ -650,22 +806,7 @@ class FirstRunDialog(QDialog):
         self.ok_btn = QPushButton("설정 완료")
         self.ok_btn.clicked.connect(self.accept)
         self.ok_btn.setEnabled(False)
-        self.ok_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.ok_btn.setStyleSheet(_OK_BUTTON_STYLE)
         button_layout.addWidget(self.ok_btn)
         
         layout.addLayout(button_layout)
@@ -673,12 +814,11 @@ class FirstRunDialog(QDialog):
     
     def browse_folder(self):
         """폴더 선택"""
-        default_path = str(Path.home() / "Documents" / "JewelryAI")
-        
         folder = QFileDialog.getExistingDirectory(
             self,
             "작업 폴더 선택", 
-            str(Path.home() / "Documents")
+            str(Path.home() / "Documents"),
+            _DIR_DIALOG_OPTIONS
         )
         
         if folder:
@@ -696,10 +836,9 @@ class FirstRunDialog(QDialog):
         # 폴더 생성
         try:
             folder_path = Path(folder)
-            folder_path.mkdir(parents=True, exist_ok=True)
             
-            # 하위 폴더들 생성
-            created_folders = config_manager.create_work_folders(folder_path)
+            # 하위 폴더들 생성 (작업 폴더 자체도 parents=True로 함께 생성)
+            config_manager.create_work_folders(folder_path)
             
             # 설정 저장
             config_manager.set_work_folder(folder)
@@ -0,0 +1,25 @@
+"""
+배치 처리기 테스트
+"""
+from src import batch_processor
+from src.batch_processor import BatchProcessor
+
+
+def test_process_executor_batch_runs_every_file(monkeypatch, tmp_path):
+    """프로세스 풀 실행 시 작업 함수가 피클링되어 모든 파일이 처리되는지 확인"""
+    monkeypatch.setattr(batch_processor, "BATCH_EXECUTOR", "process")
+
+    # 존재하지 않는 파일은 API 호출 없이 generate_all 단계에서 실패 결과를 반환
+    files = [tmp_path / f"missing_{i}.png" for i in range(3)]
+    processor = BatchProcessor(max_workers=2)
+
+    results = dict(processor.process_batch(files, "ring"))
+
+    assert set(results) == set(files)
+    for result in results.values():
+        assert result.get("success") is not True
+        # 작업 제출 단계의 피클링 오류가 아니라 파일 처리 결과여야 함
+        assert "pickle" not in str(result.get("error", ""))
+
+    stats = processor.get_stats()
+    assert stats["processed"] == len(files)